@@ -5,7 +5,14 @@ A modular OCR tool supporting Tesseract and Claude Vision AI.
 """
 
 from transcriptor.config import Config
-from transcriptor.pipeline import Pipeline
 
 __version__ = "1.0.0"
 __all__ = ["Config", "Pipeline"]
+
+
+def __getattr__(name: str):
+    """Import the pipeline (and its engines) on first use."""
+    if name == "Pipeline":
+        from transcriptor.pipeline import Pipeline
+        return Pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,33 +6,51 @@ Separates CLI concerns from the core processing logic.
 """
 
 import argparse
+import asyncio
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from transcriptor.config import (
+    FLAG_AUTO_ROTATE,
+    FLAG_CHEAPO,
+    FLAG_CLEANUP,
+    FLAG_EXPENSIVE,
+    FLAG_NO_CACHE,
+    FLAG_OFFLINE_BATCH,
+    FLAG_REFLOW,
     Config,
     Engine,
     PreprocessMode,
+    PREPROCESS_CHOICES,
     PREPROCESS_DESCRIPTIONS,
-    PSM_MODES,
+    PREPROCESS_NAME_WIDTH,
+    PSM_CHOICES,
 )
-from transcriptor.engines.tesseract import TesseractEngine
-from transcriptor.pipeline import Pipeline
+
+# Engines and the pipeline pull in PIL, pytesseract and the Anthropic SDK;
+# they are imported where needed so --help and --list-preprocess start fast.
+if TYPE_CHECKING:
+    from transcriptor.engines.base import OCREngine
+
+
+# Leave one CPU free for the main process
+_CPU_COUNT = max(1, (os.cpu_count() or 2) - 1)
 
 
 def get_cpu_count() -> int:
     """Get number of available CPUs for parallel processing."""
-    try:
-        count = os.cpu_count()
-        return max(1, count - 1) if count and count > 1 else 1
-    except Exception:
-        return 1
+    return _CPU_COUNT
 
 
+@cache
 def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
+    """Create and configure the argument parser (built once per process)."""
     parser = argparse.ArgumentParser(
         description="Transcribe scanned PDF documents to text using OCR.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -89,6 +107,7 @@ Preprocessing options:
   none       - No preprocessing (fastest)
   grayscale  - Convert to grayscale
   binarize   - Black/white (good for faded text)
+  adaptive   - Black/white with a local threshold (uneven lighting)
   contrast   - Enhance contrast
   sharpen    - Sharpen edges
   denoise    - Remove noise/speckles
@@ -146,6 +165,15 @@ Tips for poor quality scans:
              "Use 300+ for poor quality scans"
     )
 
+    parser.add_argument(
+        "--max-dim",
+        type=int,
+        default=3500,
+        metavar="PX",
+        help="Limit page images to PX pixels on the longest edge: large "
+             "pages render at a lower DPI (default: 3500, 0 = no limit)"
+    )
+
     parser.add_argument(
         "-l", "--lang",
         default="eng",
@@ -186,6 +214,7 @@ Tips for poor quality scans:
         "--cleanup",
         action="store_true",
         help="Post-process with AI to fix OCR errors. Creates *_clean.md files alongside raw output. "
+             "Runs on Haiku, escalating to the OCR model when text is dropped. "
              "Requires Claude engine or ANTHROPIC_API_KEY"
     )
 
@@ -209,10 +238,18 @@ Tips for poor quality scans:
         help="Use Opus 4 instead of Sonnet 4.5 (slower and pricier, but highest quality)"
     )
 
+    parser.add_argument(
+        "--offline-batch",
+        action="store_true",
+        help="Submit pages through the Message Batches API: 50%% cheaper and "
+             "outside the online rate limits, but results can take hours. "
+             "Only works with --engine claude"
+    )
+
     # Preprocessing options
     parser.add_argument(
         "-p", "--preprocess",
-        choices=[m.value for m in PreprocessMode],
+        choices=PREPROCESS_CHOICES,
         default="none",
         help="Image preprocessing mode (default: none). "
              "Use 'all' for poor quality scans"
@@ -242,7 +279,7 @@ Tips for poor quality scans:
     parser.add_argument(
         "--psm",
         type=int,
-        choices=[3, 4, 6, 11, 12],
+        choices=PSM_CHOICES,
         default=3,
         help="Tesseract Page Segmentation Mode (default: 3). "
              "Use 6 for single text blocks, 11 for sparse text"
@@ -257,6 +294,14 @@ Tips for poor quality scans:
              "0=legacy, 1=LSTM, 2=both, 3=auto"
     )
 
+    # Cache options
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the page cache (output/<doc>/.cache/). "
+             "By default, pages already OCR'd with the same settings are reused"
+    )
+
     # Utility options
     parser.add_argument(
         "--list-langs",
@@ -276,7 +321,7 @@ Tips for poor quality scans:
 def parse_workers(value: str) -> int:
     """Parse workers argument to integer."""
     if value.lower() == "auto":
-        return get_cpu_count()
+        return _CPU_COUNT
 
     try:
         workers = int(value)
@@ -286,39 +331,108 @@ def parse_workers(value: str) -> int:
         sys.exit(1)
 
 
+# One comma-separated part of a --pages spec: "7" or "10-12"
+_PAGE_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
+
+
+@lru_cache(maxsize=64)
+def parse_pages_spec(spec: str) -> Tuple[int, ...]:
+    """
+    Parse a --pages specification into sorted 1-based page numbers.
+
+    Cached by the raw string so batch runs parse it once. Pages beyond
+    the end of a document are filtered by the pipeline once the page
+    count is known.
+
+    Args:
+        spec: Page specification, e.g. "5", "1-5" or "1-3,7,10-12"
+
+    Returns:
+        Sorted tuple of unique page numbers
+
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    # Fast path: a single page number
+    if spec.isdigit():
+        page = int(spec)
+        return (page,) if page >= 1 else ()
+
+    pages = set()
+    for part in spec.split(","):
+        match = _PAGE_RE.fullmatch(part)
+        if not match:
+            raise ValueError(f"Invalid page specification: '{part}'")
+        start, end = match.groups()
+        if end is None:
+            pages.add(int(start))
+        else:
+            pages.update(range(int(start), int(end) + 1))
+    pages.discard(0)
+    return tuple(sorted(pages))
+
+
 def args_to_config(args: argparse.Namespace) -> Config:
     """Convert parsed arguments to Config object."""
+    pages_set = None
+    try:
+        if args.pages:
+            pages_set = frozenset(parse_pages_spec(args.pages))
+        elif args.first:
+            pages_set = frozenset(range(1, args.first + 1))
+    except ValueError:
+        print(f"Error: Invalid pages value '{args.pages}'. "
+              f"Use e.g. '5', '1-5' or '1-3,7,10-12'")
+        sys.exit(1)
+
+    flags = 0
+    if args.cheapo:
+        flags |= FLAG_CHEAPO
+    if args.expensive:
+        flags |= FLAG_EXPENSIVE
+    if args.cleanup:
+        flags |= FLAG_CLEANUP
+    if args.reflow:
+        flags |= FLAG_REFLOW
+    if args.rotate:
+        flags |= FLAG_AUTO_ROTATE
+    if args.no_cache:
+        flags |= FLAG_NO_CACHE
+    if args.offline_batch:
+        flags |= FLAG_OFFLINE_BATCH
+
     config = Config(
         pdf_path=args.pdf,
-        output_path=args.output,
-        title=args.title,
+        output_path=args.output or "",
+        title=args.title or "",
+        flags=flags,
         engine=Engine(args.engine),
         dpi=args.dpi,
-        lang=args.lang,
+        max_dim=args.max_dim,
+        # Interned so per-page language lookups hash a shared object
+        lang=sys.intern(args.lang),
         workers=parse_workers(args.workers),
         batch_size=args.batch_size,
-        pages=args.pages,
+        pages=args.pages or "",
         first_n=args.first,
-        cleanup=args.cleanup,
-        reflow=args.reflow,
-        cheapo=args.cheapo,
-        expensive=args.expensive,
+        pages_set=pages_set,
         preprocess=PreprocessMode(args.preprocess),
         psm=args.psm,
         oem=args.oem,
-        auto_rotate=args.rotate,
         rotate_confidence=args.rotate_confidence,
     )
 
     # Apply --enhance preset
     if args.enhance:
-        config.apply_enhance_preset()
+        config = config.with_enhance_preset()
 
     return config
 
 
 def list_languages() -> None:
     """List available Tesseract languages."""
+    from transcriptor.engines.tesseract import TesseractEngine
+
     engine = TesseractEngine()
     if not engine.is_available():
         print("Tesseract is not installed.")
@@ -333,39 +447,298 @@ def list_languages() -> None:
 def list_preprocess_options() -> None:
     """List preprocessing options."""
     print("Preprocessing options:")
-    for mode, desc in PREPROCESS_DESCRIPTIONS.items():
-        print(f"  {mode.value:12} - {desc}")
+    for mode, desc in PREPROCESS_DESCRIPTIONS:
+        print(f"  {mode.value:{PREPROCESS_NAME_WIDTH}} - {desc}")
+
+
+@cache
+def _get_engine(
+    engine_kind: Engine,
+    claude_model: str,
+    psm: int,
+    oem: int,
+    auto_rotate: bool,
+    rotate_confidence: float,
+    use_cache: bool
+) -> "OCREngine":
+    """
+    Build and validate one engine per distinct engine setting.
+
+    Cached so a batch validates the engine (a subprocess probe for
+    Tesseract) once per process instead of once per PDF.
+
+    Raises:
+        EngineNotAvailableError: If the engine cannot be used
+    """
+    if engine_kind is Engine.CLAUDE:
+        from transcriptor.engines.claude import ClaudeEngine
+        engine = ClaudeEngine(model=claude_model, use_cache=use_cache)
+    else:
+        from transcriptor.engines.tesseract import TesseractEngine
+        engine = TesseractEngine(
+            psm=psm,
+            oem=oem,
+            auto_rotate=auto_rotate,
+            rotate_confidence=rotate_confidence
+        )
+
+    engine.validate()
+    return engine
+
+
+def _engine_for(config: Config) -> "OCREngine":
+    """Get the shared, validated engine for a config."""
+    return _get_engine(
+        config.engine, config.claude_model, config.psm, config.oem,
+        config.auto_rotate, config.rotate_confidence, config.use_cache
+    )
+
+
+def run_config(
+    config: Config,
+    shared_engine: bool = False
+) -> Tuple[str, Optional[Path], Optional[str]]:
+    """
+    Run the pipeline for a single PDF config.
+
+    Args:
+        config: Configuration for the PDF
+        shared_engine: Reuse the process-wide validated engine (batch mode)
+
+    Returns:
+        Tuple of (pdf_path, output_path, error message)
+    """
+    from transcriptor.pipeline import Pipeline
+
+    try:
+        engine = _engine_for(config) if shared_engine else None
+        pipeline = Pipeline(config, engine=engine)
+        return config.pdf_path, pipeline.run(), None
+    except Exception as e:
+        return config.pdf_path, None, str(e)
+
+
+class _LabeledOutput:
+    """
+    Stdout wrapper that tags every line with a document label.
+
+    Batch workers print concurrently, so output is written a whole line
+    at a time (partial lines wait for their newline) and each non-blank
+    line starts with the label.
+    """
+
+    def __init__(self, stream: Any, label: str):
+        self._stream = stream
+        self._label = label
+        self._pending = ""
+
+    def write(self, text: str) -> int:
+        lines = (self._pending + text).split("\n")
+        self._pending = lines.pop()
+        if lines:
+            self._stream.write("".join(
+                f"{self._label}{line}\n" if line else "\n" for line in lines
+            ))
+            self._stream.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        """Partial lines are held back; see write()."""
+
+    def close(self) -> None:
+        """Write out a trailing partial line."""
+        if self._pending:
+            self.write("\n")
+
+
+def run_one(
+    pdf_path: str,
+    args_dict: Dict[str, Any]
+) -> Tuple[str, Optional[Path], Optional[str]]:
+    """
+    Run the pipeline for a single PDF.
+
+    Module-level (and taking plain argument dicts) so it can be pickled
+    and dispatched to a ProcessPoolExecutor in batch mode. Output lines
+    are prefixed with the PDF's name, as several run at once.
+
+    Args:
+        pdf_path: Path to the PDF file
+        args_dict: Parsed CLI arguments as a dict (``vars(args)``)
+
+    Returns:
+        Tuple of (pdf_path, output_path, error message)
+    """
+    args = argparse.Namespace(**args_dict)
+    args.pdf = pdf_path
+    output = _LabeledOutput(sys.stdout, f"[{Path(pdf_path).name}] ")
+    try:
+        with redirect_stdout(output):
+            print(f"📄 Processing: {Path(pdf_path).name}")
+            return run_config(args_to_config(args), shared_engine=True)
+    finally:
+        output.close()
+
+
+async def run_batch_async(
+    configs: List[Config]
+) -> Tuple[List[Path], List[Tuple[str, str]]]:
+    """
+    Process several PDFs with Claude on one async client.
+
+    All pipelines share a single engine (one AsyncAnthropic client and
+    rate limiter) and one semaphore per stage (OCR, cleanup), so the
+    tier's concurrency is spread over every page of every PDF with no
+    serial gap between documents.
+
+    Args:
+        configs: One Config per PDF
+
+    Returns:
+        Tuple of (output paths, [(pdf_path, error)])
+    """
+    from transcriptor.pipeline import Pipeline
+
+    engine = _engine_for(configs[0])
+    semaphore = asyncio.Semaphore(configs[0].effective_workers)
+    cleanup_semaphore = asyncio.Semaphore(configs[0].effective_workers)
+    pipelines = [Pipeline(config, engine=engine) for config in configs]
+
+    outcomes = await asyncio.gather(
+        *(pipeline.run_async(semaphore, cleanup_semaphore)
+          for pipeline in pipelines),
+        return_exceptions=True
+    )
+
+    results = []
+    errors = []
+    for config, outcome in zip(configs, outcomes):
+        basename = os.path.basename(config.pdf_path)
+        if isinstance(outcome, Exception):
+            print(f"\n❌ {basename}: {outcome}")
+            errors.append((config.pdf_path, str(outcome)))
+        else:
+            results.append(outcome)
+            print(f"\n✅ {basename} → {outcome}")
+
+    return results, errors
+
+
+def run_batch(
+    pdf_files: List[str],
+    args: argparse.Namespace
+) -> Tuple[List[Path], List[Tuple[str, str]]]:
+    """
+    Process several PDFs concurrently.
+
+    The engine is validated once up-front instead of once per PDF. Claude
+    batches run on the async client (see run_batch_async); Tesseract
+    batches are CPU-bound and go to a process pool.
+
+    Args:
+        pdf_files: PDF paths to process
+        args: Parsed CLI arguments
+
+    Returns:
+        Tuple of (output paths, [(pdf_path, error)])
+    """
+    configs = []
+    for pdf_path in pdf_files:
+        args.pdf = pdf_path
+        configs.append(args_to_config(args))
+
+    try:
+        _engine_for(configs[0])
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+    if configs[0].engine is Engine.CLAUDE:
+        return asyncio.run(run_batch_async(configs))
+
+    # Leave room for each PDF's own page-level workers
+    per_pdf = parse_workers(args.workers)
+    max_workers = min(len(pdf_files), max(1, get_cpu_count() // per_pdf))
+    args_dict = vars(args)
+
+    results = []
+    errors = []
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(run_one, pdf_path, args_dict)
+            for pdf_path in pdf_files
+        ]
+
+        for future in as_completed(futures):
+            pdf_path, result, error = future.result()
+            basename = os.path.basename(pdf_path)
+            if error is None:
+                results.append(result)
+                print(f"\n✅ {basename} → {result}")
+            else:
+                print(f"\n❌ {basename}: {error}")
+                errors.append((pdf_path, error))
+
+    return results, errors
+
+
+def _fast_path_pdf(argv: List[str]) -> Optional[str]:
+    """
+    Detect the bare ``main.py document.pdf`` invocation.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        The PDF path if it is the only argument, else None
+    """
+    if len(argv) == 1 and argv[0].endswith(".pdf") and not argv[0].startswith("-"):
+        return argv[0]
+    return None
 
 
 def main() -> None:
     """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
-
-    # Handle utility commands
-    if args.list_langs:
-        list_languages()
-        sys.exit(0)
-
-    if args.list_preprocess:
-        list_preprocess_options()
-        sys.exit(0)
-
-    # Determine PDF files to process
-    pdf_files = []
-    if args.pdf:
-        pdf_files = [args.pdf]
-    else:
-        # Check input/ folder for PDFs
-        input_dir = Path("input")
-        if input_dir.exists():
-            pdf_files = sorted([str(f) for f in input_dir.glob("*.pdf")])
+    fast_pdf = _fast_path_pdf(sys.argv[1:])
 
-        if not pdf_files:
-            print("No PDF specified and no PDFs found in input/ folder.")
-            print("Usage: python main.py document.pdf")
-            print("   or: place PDFs in input/ folder and run without arguments")
-            sys.exit(1)
+    if fast_pdf:
+        # All defaults: skip building the argument parser entirely
+        args = None
+        pdf_files = [fast_pdf]
+    else:
+        parser = create_parser()
+        args = parser.parse_args()
+
+        # Handle utility commands
+        if args.list_langs:
+            list_languages()
+            sys.exit(0)
+
+        if args.list_preprocess:
+            list_preprocess_options()
+            sys.exit(0)
+
+        # Determine PDF files to process
+        pdf_files = []
+        if args.pdf:
+            pdf_files = [args.pdf]
+        else:
+            # Check input/ folder for PDFs
+            try:
+                with os.scandir("input") as entries:
+                    pdf_files = sorted(
+                        entry.path for entry in entries
+                        if entry.name.endswith(".pdf") and entry.is_file()
+                    )
+            except FileNotFoundError:
+                pass
+
+            if not pdf_files:
+                print("No PDF specified and no PDFs found in input/ folder.")
+                print("Usage: python main.py document.pdf")
+                print("   or: place PDFs in input/ folder and run without arguments")
+                sys.exit(1)
 
     # Print header
     print("=" * 50)
@@ -377,29 +750,19 @@ def main() -> None:
         print("-" * 50)
 
     # Process each PDF
-    results = []
-    errors = []
-
-    for pdf_path in pdf_files:
-        args.pdf = pdf_path
-        config = args_to_config(args)
-
-        if len(pdf_files) > 1:
-            print(f"\n📄 Processing: {Path(pdf_path).name}")
-            print("-" * 50)
-
-        try:
-            pipeline = Pipeline(config)
-            result = pipeline.run()
+    if len(pdf_files) > 1:
+        results, errors = run_batch(pdf_files, args)
+    else:
+        results, errors = [], []
+        config = args_to_config(args) if args else Config(pdf_path=fast_pdf)
+        pdf_path, result, error = run_config(config)
+        if error is None:
             results.append(result)
             print(f"\n✅ Transcription complete!")
             print(f"   File: {result}")
-        except FileNotFoundError as e:
-            print(f"\n❌ Error: {e}")
-            errors.append((pdf_path, str(e)))
-        except Exception as e:
-            print(f"\n❌ Error: {e}")
-            errors.append((pdf_path, str(e)))
+        else:
+            print(f"\n❌ Error: {error}")
+            errors.append((pdf_path, error))
 
     # Print batch summary
     if len(pdf_files) > 1:
@@ -410,7 +773,7 @@ def main() -> None:
         if errors:
             print(f"   Failed: {len(errors)}")
             for path, err in errors:
-                print(f"      - {Path(path).name}: {err}")
+                print(f"      - {os.path.basename(path)}: {err}")
 
     if errors and not results:
         sys.exit(1)
@@ -8,9 +8,11 @@ This module centralizes all configuration, making it easy to:
 """
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import cache
 from enum import StrEnum
-from typing import Optional
+from pathlib import Path
+from typing import FrozenSet, Optional
 
 # Load .env file if available
 try:
@@ -31,6 +33,7 @@ class PreprocessMode(StrEnum):
     NONE = "none"
     GRAYSCALE = "grayscale"
     BINARIZE = "binarize"
+    ADAPTIVE = "adaptive"
     CONTRAST = "contrast"
     SHARPEN = "sharpen"
     DENOISE = "denoise"
@@ -41,30 +44,42 @@ class PreprocessMode(StrEnum):
     ALL = "all"
 
 
-# Preprocessing descriptions for CLI help
-PREPROCESS_DESCRIPTIONS = {
-    PreprocessMode.NONE: "No preprocessing",
-    PreprocessMode.GRAYSCALE: "Convert to grayscale",
-    PreprocessMode.BINARIZE: "Convert to black/white (good for faded text)",
-    PreprocessMode.CONTRAST: "Enhance contrast",
-    PreprocessMode.SHARPEN: "Sharpen edges",
-    PreprocessMode.DENOISE: "Remove noise/speckles",
-    PreprocessMode.REMOVE_RED: "Remove red highlights/marks only",
-    PreprocessMode.REMOVE_BLUE: "Remove blue highlights/marks only",
-    PreprocessMode.SOFT: "Remove red + contrast + sharpen (NO binarization)",
-    PreprocessMode.CLEAN: "Remove red + all enhancements including binarization",
-    PreprocessMode.ALL: "Apply all preprocessing (no highlight removal)",
-}
+# Preprocessing descriptions for CLI help, in display order
+PREPROCESS_DESCRIPTIONS = (
+    (PreprocessMode.NONE, "No preprocessing"),
+    (PreprocessMode.GRAYSCALE, "Convert to grayscale"),
+    (PreprocessMode.BINARIZE, "Convert to black/white (good for faded text)"),
+    (PreprocessMode.ADAPTIVE, "Black/white with a local threshold (uneven lighting)"),
+    (PreprocessMode.CONTRAST, "Enhance contrast"),
+    (PreprocessMode.SHARPEN, "Sharpen edges"),
+    (PreprocessMode.DENOISE, "Remove noise/speckles"),
+    (PreprocessMode.REMOVE_RED, "Remove red highlights/marks only"),
+    (PreprocessMode.REMOVE_BLUE, "Remove blue highlights/marks only"),
+    (PreprocessMode.SOFT, "Remove red + contrast + sharpen (NO binarization)"),
+    (PreprocessMode.CLEAN, "Remove red + all enhancements including binarization"),
+    (PreprocessMode.ALL, "Apply all preprocessing (no highlight removal)"),
+)
+
+# Values accepted by --preprocess
+PREPROCESS_CHOICES = tuple(m.value for m in PreprocessMode)
+
+# Column width for aligned listings of preprocessing modes
+PREPROCESS_NAME_WIDTH = max(
+    len(mode.value) for mode, _ in PREPROCESS_DESCRIPTIONS
+)
 
 
 # Tesseract Page Segmentation Modes
-PSM_MODES = {
-    3: "Fully automatic page segmentation (default)",
-    4: "Assume single column of variable sizes",
-    6: "Assume single uniform block of text",
-    11: "Sparse text - find as much text as possible",
-    12: "Sparse text with OSD",
-}
+PSM_MODES = (
+    (3, "Fully automatic page segmentation (default)"),
+    (4, "Assume single column of variable sizes"),
+    (6, "Assume single uniform block of text"),
+    (11, "Sparse text - find as much text as possible"),
+    (12, "Sparse text with OSD"),
+)
+
+# Values accepted by --psm
+PSM_CHOICES = tuple(psm for psm, _ in PSM_MODES)
 
 
 # Language code to full name mapping
@@ -78,11 +93,24 @@ LANGUAGE_NAMES = {
 }
 
 
+@cache
+def get_language_name(code: str) -> str:
+    """Get the full language name for a code, falling back to the code."""
+    return LANGUAGE_NAMES.get(code, code)
+
+
+# Per-user cache for engine results shared across documents and runs
+CACHE_DIR = Path(
+    os.getenv("PDF_SCRIBE_CACHE_DIR", Path.home() / ".cache" / "pdf-scribe")
+)
+
+
 class ClaudeModels:
     """Claude model configuration."""
     DEFAULT = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-5-20250929")
     CHEAPO = os.getenv("CLAUDE_CHEAPO_MODEL", "claude-haiku-4-5-20251001")
     EXPENSIVE = os.getenv("CLAUDE_EXPENSIVE_MODEL", "claude-opus-4-5-20251101")
+    CLEANUP = os.getenv("CLAUDE_CLEANUP_MODEL", "claude-haiku-4-5-20251001")
 
 
 class TierConfig:
@@ -94,6 +122,9 @@ class TierConfig:
     - Tier 2: 1000 RPM
     - Tier 3: 2000 RPM
     - Tier 4: 4000 RPM
+
+    Input (ITPM) and output (OTPM) token limits are tracked separately
+    per tier.
     """
     TIER = int(os.getenv("ANTHROPIC_TIER", "1"))
 
@@ -105,43 +136,110 @@ class TierConfig:
         4: 3200,
     }
 
+    # Requests per minute
+    RPM = {
+        1: 50,
+        2: 1000,
+        3: 2000,
+        4: 4000,
+    }
+
+    # Input tokens per minute (Sonnet-class limits)
+    INPUT_TPM = {
+        1: 30_000,
+        2: 450_000,
+        3: 800_000,
+        4: 2_000_000,
+    }
+
+    # Output tokens per minute (Sonnet-class limits)
+    OUTPUT_TPM = {
+        1: 8_000,
+        2: 90_000,
+        3: 160_000,
+        4: 400_000,
+    }
+
     @classmethod
+    @cache
     def get_workers(cls) -> int:
         """Get the optimal number of workers for the current tier."""
         return cls.WORKERS.get(cls.TIER, 40)
 
+    @classmethod
+    @cache
+    def get_input_tpm(cls) -> int:
+        """Get the input-tokens-per-minute budget for the current tier."""
+        return cls.INPUT_TPM.get(cls.TIER, 30_000)
+
+    @classmethod
+    @cache
+    def get_rpm(cls) -> int:
+        """Get the requests-per-minute limit for the current tier."""
+        return cls.RPM.get(cls.TIER, 50)
+
+    @classmethod
+    @cache
+    def get_output_tpm(cls) -> int:
+        """Get the output-tokens-per-minute budget for the current tier."""
+        return cls.OUTPUT_TPM.get(cls.TIER, 8_000)
+
+
+# Preprocessing modes that need the color render
+_COLOR_PREPROCESS = frozenset((
+    PreprocessMode.NONE, PreprocessMode.REMOVE_RED, PreprocessMode.REMOVE_BLUE,
+    PreprocessMode.SOFT, PreprocessMode.CLEAN,
+))
+
+
+# Boolean option bits for Config.flags
+FLAG_CHEAPO = 1
+FLAG_EXPENSIVE = 2
+FLAG_CLEANUP = 4
+FLAG_REFLOW = 8
+FLAG_AUTO_ROTATE = 16
+FLAG_NO_CACHE = 32
+FLAG_OFFLINE_BATCH = 64
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Config:
     """
     Main configuration container.
 
     Encapsulates all settings for a transcription run, making it easy
-    to pass around and modify settings without long parameter lists.
+    to pass around without long parameter lists. Instances are immutable;
+    use ``dataclasses.replace`` to derive a modified copy. Derived values
+    (model, workers, mode suffix) are computed once in
+    ``__post_init__`` rather than on every access.
+
+    Boolean options are packed into the ``flags`` bitmask (FLAG_*
+    constants) and exposed as read-only properties. Unset strings
+    are "" rather than None.
     """
     # Input/Output
     pdf_path: str = ""
-    output_path: Optional[str] = None
-    title: Optional[str] = None
+    output_path: str = ""
+    title: str = ""
 
     # Engine selection
     engine: Engine = Engine.TESSERACT
 
-    # Claude-specific
-    cheapo: bool = False
-    expensive: bool = False
-    cleanup: bool = False
-    reflow: bool = False
+    # Boolean options: FLAG_CHEAPO | FLAG_EXPENSIVE | FLAG_CLEANUP |
+    # FLAG_REFLOW | FLAG_AUTO_ROTATE | FLAG_NO_CACHE | FLAG_OFFLINE_BATCH
+    flags: int = 0
 
     # Processing settings
     dpi: int = 150
+    max_dim: int = 3500  # Longest page image edge, in pixels (0 = no limit)
     lang: str = "eng"
     workers: int = 1
     batch_size: int = 20
 
     # Page selection
-    pages: Optional[str] = None
+    pages: str = ""
     first_n: Optional[int] = None
+    pages_set: Optional[FrozenSet[int]] = None  # Parsed pages/first_n
 
     # Preprocessing
     preprocess: PreprocessMode = PreprocessMode.NONE
@@ -150,42 +248,115 @@ class Config:
     # Tesseract-specific
     psm: int = 3
     oem: int = 3
-    auto_rotate: bool = False
     rotate_confidence: float = 5.0
 
+    # Derived values, precomputed in __post_init__
+    _claude_model: str = field(init=False, repr=False, compare=False)
+    _effective_workers: int = field(init=False, repr=False, compare=False)
+    _mode_suffix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute derived values (frozen, so bypass __setattr__)."""
+        # Normalize plain strings to the enum singletons so hot paths
+        # can compare with `is`
+        object.__setattr__(self, "engine", Engine(self.engine))
+        object.__setattr__(self, "preprocess", PreprocessMode(self.preprocess))
+
+        if self.expensive:
+            model = ClaudeModels.EXPENSIVE
+            suffix = " [expensive mode]"
+        elif self.cheapo:
+            model = ClaudeModels.CHEAPO
+            suffix = " [cheapo mode]"
+        else:
+            model = ClaudeModels.DEFAULT
+            suffix = ""
+
+        if self.engine is Engine.CLAUDE and self.workers == 1:
+            workers = TierConfig.get_workers()
+        else:
+            workers = self.workers
+
+        object.__setattr__(self, "_claude_model", model)
+        object.__setattr__(self, "_effective_workers", workers)
+        object.__setattr__(self, "_mode_suffix", suffix)
+
+    @property
+    def cheapo(self) -> bool:
+        """Use the cheaper Claude model."""
+        return bool(self.flags & FLAG_CHEAPO)
+
+    @property
+    def expensive(self) -> bool:
+        """Use the most capable Claude model."""
+        return bool(self.flags & FLAG_EXPENSIVE)
+
+    @property
+    def cleanup(self) -> bool:
+        """Run the AI cleanup pass."""
+        return bool(self.flags & FLAG_CLEANUP)
+
+    @property
+    def reflow(self) -> bool:
+        """Reflow text into paragraphs (Claude only)."""
+        return bool(self.flags & FLAG_REFLOW)
+
+    @property
+    def auto_rotate(self) -> bool:
+        """Auto-detect and correct page orientation (Tesseract only)."""
+        return bool(self.flags & FLAG_AUTO_ROTATE)
+
+    @property
+    def use_cache(self) -> bool:
+        """Read and write the on-disk page cache."""
+        return not self.flags & FLAG_NO_CACHE
+
+    @property
+    def offline_batch(self) -> bool:
+        """Send Claude requests through the Message Batches API."""
+        return bool(self.flags & FLAG_OFFLINE_BATCH)
+
+    @property
+    def render_grayscale(self) -> bool:
+        """
+        Render pages as grayscale: preprocessing would drop the color.
+
+        Modes that read a color channel (highlight removal, soft, clean)
+        and "none" keep the RGB render.
+        """
+        return self.preprocess not in _COLOR_PREPROCESS
+
     @property
     def claude_model(self) -> str:
         """Get the appropriate Claude model based on mode flags."""
-        if self.expensive:
-            return ClaudeModels.EXPENSIVE
-        elif self.cheapo:
-            return ClaudeModels.CHEAPO
-        return ClaudeModels.DEFAULT
+        return self._claude_model
+
+    @property
+    def cleanup_model(self) -> str:
+        """Get the model for the cleanup pass (escalates to claude_model)."""
+        return ClaudeModels.CLEANUP
 
     @property
     def effective_workers(self) -> int:
         """Get effective worker count, using tier-based defaults for Claude."""
-        if self.engine == Engine.CLAUDE and self.workers == 1:
-            return TierConfig.get_workers()
-        return self.workers
+        return self._effective_workers
 
     @property
     def language_name(self) -> str:
         """Get full language name for prompts."""
-        return LANGUAGE_NAMES.get(self.lang, self.lang)
+        return get_language_name(self.lang)
 
     @property
     def mode_suffix(self) -> str:
         """Get mode suffix for display."""
-        if self.expensive:
-            return " [expensive mode]"
-        elif self.cheapo:
-            return " [cheapo mode]"
-        return ""
-
-    def apply_enhance_preset(self) -> None:
-        """Apply the --enhance preset settings."""
-        self.preprocess = PreprocessMode.ALL
-        self.auto_rotate = True
-        if self.dpi == 150:  # Only override if default
-            self.dpi = 300
+        return self._mode_suffix
+
+    def with_enhance_preset(self) -> "Config":
+        """Return a copy with the --enhance preset settings applied."""
+        return replace(
+            self,
+            preprocess=PreprocessMode.ALL,
+            flags=self.flags | FLAG_AUTO_ROTATE,
+            # Only override DPI if it's still the default
+            dpi=300 if self.dpi == 150 else self.dpi,
+        )
@@ -1,7 +1,16 @@
 """OCR Engine implementations."""
 
 from transcriptor.engines.base import OCREngine, OCRResult
-from transcriptor.engines.tesseract import TesseractEngine
-from transcriptor.engines.claude import ClaudeEngine
 
 __all__ = ["OCREngine", "OCRResult", "TesseractEngine", "ClaudeEngine"]
+
+
+def __getattr__(name: str):
+    """Import concrete engines on first use (they pull in heavy SDKs)."""
+    if name == "TesseractEngine":
+        from transcriptor.engines.tesseract import TesseractEngine
+        return TesseractEngine
+    if name == "ClaudeEngine":
+        from transcriptor.engines.claude import ClaudeEngine
+        return ClaudeEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
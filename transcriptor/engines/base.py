@@ -13,28 +13,53 @@ from typing import Optional
 from PIL import Image
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """
     Result from an OCR operation.
 
+    One of these is allocated per page, so it uses slots and an integer
+    error code; the error message is only stored on failure.
+
     Attributes:
         page_num: The page number that was processed
         text: The extracted text (None if failed)
         cleaned_text: AI-cleaned text (None if cleanup not performed)
         rotation: Rotation angle applied (Tesseract only)
-        error: Error message if operation failed
+        error_code: ERR_OK, or the stage that failed
+        error_detail: Error message if operation failed
     """
     page_num: int
     text: Optional[str] = None
     cleaned_text: Optional[str] = None
     rotation: int = 0
-    error: Optional[str] = None
+    error_code: int = 0
+    error_detail: Optional[str] = None
+
+    # Error codes
+    ERR_OK = 0
+    ERR_ENGINE = 1
+    ERR_PREPROCESS = 2
+
+    @classmethod
+    def failure(
+        cls,
+        page_num: int,
+        detail: str,
+        code: int = ERR_ENGINE
+    ) -> "OCRResult":
+        """Build a failed result for a page."""
+        return cls(page_num=page_num, error_code=code, error_detail=detail)
+
+    @property
+    def error(self) -> Optional[str]:
+        """Error message if the operation failed, else None."""
+        return self.error_detail if self.error_code else None
 
     @property
     def success(self) -> bool:
         """Check if OCR was successful."""
-        return self.text is not None and self.error is None
+        return self.error_code == 0 and self.text is not None
 
     @property
     def final_text(self) -> Optional[str]:
@@ -5,14 +5,24 @@ This module provides OCR using Anthropic's Claude Vision API.
 Best for degraded documents, handwriting, and complex layouts.
 """
 
+import asyncio
 import base64
+import hashlib
 import io
-from typing import Optional
+import re
+import threading
+import time
+import weakref
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from PIL import Image
+from PIL import Image, ImageStat
 
-from transcriptor.engines.base import OCREngine, OCRError
-from transcriptor.config import LANGUAGE_NAMES, ClaudeModels
+from transcriptor.engines.base import OCREngine, OCRError, OCRResult
+from transcriptor.config import (
+    CACHE_DIR, ClaudeModels, TierConfig, get_language_name
+)
+from transcriptor.utils.cache import ResultCache
 
 # Optional import - gracefully handle missing dependency
 try:
@@ -22,6 +32,251 @@ except ImportError:
     anthropic = None
     CLAUDE_AVAILABLE = False
 
+# Optional SIMD base64 encoder - falls back to the stdlib
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    pybase64 = None
+    PYBASE64_AVAILABLE = False
+
+
+# Retry policy for rate-limited (429) and overloaded (529) responses
+MAX_RETRIES = 5
+BASE_RETRY_DELAY = 1.0
+
+# Default number of in-flight requests for process_batch
+DEFAULT_CONCURRENCY = 8
+
+# Bump when the prompts change so cached results are not reused
+_PROMPT_VERSION = "v1"
+
+# Seconds between status checks of an offline Message Batch
+BATCH_POLL_INTERVAL = 30.0
+
+
+def _b64encode(data) -> str:
+    """Base64-encode bytes or any buffer (e.g. a memoryview) to a str."""
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+# Static prompt instructions, sent as prompt-cached system blocks. The
+# language and the text to clean go in the per-request user message.
+OCR_INSTRUCTIONS = """Transcribe ALL the text from this scanned document image exactly as it appears.
+
+Instructions:
+- Transcribe every word, number, and punctuation mark exactly as shown
+- Preserve the original paragraph structure
+- If text is faded or unclear, make your best interpretation based on context
+- Ignore any highlighter marks, stamps, or non-text elements
+- Do NOT add any commentary, notes, or headers - only output the transcribed text
+- Do NOT add titles like "TRANSCRIBED TEXT", "DOCUMENTO TRANSCRITO", or similar
+- Do NOT translate - keep the original language
+- Start directly with the document content"""
+
+OCR_REFLOW_INSTRUCTIONS = """Transcribe ALL the text from this scanned document image.
+
+Instructions:
+- Transcribe every word, number, and punctuation mark exactly as shown
+- REFLOW the text into logical paragraphs - do NOT preserve the original line breaks
+- Join lines that are part of the same sentence or paragraph into flowing text
+- Start new paragraphs only where there is a logical break (new section, new topic, numbered clauses like "PRIMERO:", "SEGUNDO:", etc.)
+- Preserve section headers and numbered items on their own lines
+- If text is faded or unclear, make your best interpretation based on context
+- Ignore any highlighter marks, stamps, or non-text elements
+- Do NOT add any commentary, notes, or headers - only output the transcribed text
+- Do NOT add titles like "TRANSCRIBED TEXT", "DOCUMENTO TRANSCRITO", or similar
+- Do NOT translate - keep the original language
+- Start directly with the document content"""
+
+CLEANUP_INSTRUCTIONS = """You clean up OCR-transcribed text. Fix obvious errors while preserving the EXACT meaning and structure.
+
+Rules:
+- Fix character recognition errors (e.g., "rn" that should be "m", "1" that should be "l")
+- Fix broken words and sentences
+- Fix punctuation and accents
+- Preserve ALL original content - do not add, remove, or paraphrase anything
+- Keep the same paragraph structure
+- If unsure about a word, keep the original
+- Do NOT translate or summarize
+- Do NOT add any commentary"""
+
+# Cleanup of several pages in one request: each page is introduced by a
+# marker line that the model must reproduce
+CLEANUP_BATCH_INSTRUCTIONS = CLEANUP_INSTRUCTIONS + """
+
+The text contains several pages, each starting with a marker line like "--- PAGE 12 ---". Clean each page separately. Output every marker line unchanged, each followed by that page's cleaned text."""
+
+_PAGE_MARKER_RE = re.compile(r"^--- PAGE (\d+) ---$", re.MULTILINE)
+
+
+class ClaudeRateLimiter:
+    """
+    Token-bucket rate limiter shared by all Claude calls, sync and async.
+
+    Keeps three buckets - requests, input tokens and output tokens per
+    minute - that refill continuously at the tier's rate. Each request
+    waits until all three can cover it, so bursty batches are smoothed
+    to the tier caps instead of cascading into 429s. Token reservations
+    are estimates and are reconciled with the real usage afterwards.
+
+    The lock is held while waiting, so callers are served in order. The
+    async lock is bound to the running event loop, so a later
+    asyncio.run() gets a fresh one; the bucket levels carry over.
+    Blocking callers (e.g. from a thread pool) wait on a thread lock and
+    draw from the same buckets.
+    """
+
+    def __init__(self, rpm: int, itpm: int, otpm: int):
+        """
+        Initialize the limiter with full buckets.
+
+        Args:
+            rpm: Requests per minute
+            itpm: Input tokens per minute
+            otpm: Output tokens per minute
+        """
+        self.rates = (rpm, itpm, otpm)
+        self._levels = [float(rpm), float(itpm), float(otpm)]
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_lock = threading.Lock()
+        # Guards the bucket levels, which threads and the loop share
+        self._levels_lock = threading.Lock()
+
+    def _loop_lock(self) -> asyncio.Lock:
+        """The lock for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        for i, rate in enumerate(self.rates):
+            self._levels[i] = min(rate, self._levels[i] + elapsed * rate / 60)
+
+    def _try_reserve(self, needs: Tuple[int, int, int]) -> float:
+        """
+        Reserve ``needs`` if every bucket covers it.
+
+        Returns:
+            0 if reserved, else seconds until the scarcest bucket refills
+        """
+        with self._levels_lock:
+            return self._reserve_locked(needs)
+
+    def _reserve_locked(self, needs: Tuple[int, int, int]) -> float:
+        """_try_reserve with the levels lock held."""
+        self._refill()
+        # A request larger than a bucket only has to wait for a full one
+        needs = tuple(min(need, rate) for need, rate in zip(needs, self.rates))
+        wait = max(
+            (need - level) * 60 / rate
+            for need, level, rate in zip(needs, self._levels, self.rates)
+        )
+        if wait <= 0:
+            for i, need in enumerate(needs):
+                self._levels[i] -= need
+        return wait
+
+    async def acquire(
+        self,
+        requests: int = 1,
+        input_tokens: int = 0,
+        output_tokens: int = 0
+    ) -> None:
+        """Wait until the request fits in all three buckets, then reserve it."""
+        needs = (requests, input_tokens, output_tokens)
+        async with self._loop_lock():
+            while (wait := self._try_reserve(needs)) > 0:
+                await asyncio.sleep(wait)
+
+    def acquire_blocking(
+        self,
+        requests: int = 1,
+        input_tokens: int = 0,
+        output_tokens: int = 0
+    ) -> None:
+        """Blocking variant of acquire for calls made outside the loop."""
+        needs = (requests, input_tokens, output_tokens)
+        with self._thread_lock:
+            while (wait := self._try_reserve(needs)) > 0:
+                time.sleep(wait)
+
+    def record(
+        self,
+        estimated_input: int,
+        actual_input: int,
+        estimated_output: int,
+        actual_output: int
+    ) -> None:
+        """Correct token reservations with the actual usage."""
+        with self._levels_lock:
+            self._levels[1] -= actual_input - estimated_input
+            self._levels[2] -= actual_output - estimated_output
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> "anthropic.Anthropic":
+    """
+    Process-wide sync client, so every engine reuses one connection pool.
+
+    The SDK's default pool limits (1000 connections, 100 keep-alive)
+    already cover the highest tier's concurrency. Retries are handled by
+    ClaudeEngine._create so they respect the rate limiter.
+    """
+    return anthropic.Anthropic(max_retries=0)
+
+
+# Async clients by event loop; an entry goes away with its loop
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _shared_async_client(
+    loop: asyncio.AbstractEventLoop
+) -> "anthropic.AsyncAnthropic":
+    """
+    Process-wide async client for the given event loop.
+
+    Async connections are bound to the loop that opened them, so there
+    is one client per loop: a later asyncio.run() gets a fresh one, and
+    a finished loop's client is released along with the loop instead of
+    being kept alive. Retries are handled by ClaudeEngine._create_async
+    so they respect the rate limiter.
+    """
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = anthropic.AsyncAnthropic(max_retries=0)
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """
+    Get the backoff delay for a retryable API error.
+
+    Returns:
+        Seconds to wait (honoring Retry-After), or None if not retryable
+    """
+    status = getattr(error, "status_code", None)
+    if status not in (429, 529):
+        return None
+
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response else None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return BASE_RETRY_DELAY * (2 ** attempt)
+
 
 class ClaudeEngine(OCREngine):
     """
@@ -31,10 +286,39 @@ class ClaudeEngine(OCREngine):
     Supports text reflow, multi-language OCR, and AI-powered cleanup.
     """
 
+    # Claude's effective resolution; larger uploads only cost tokens
+    MAX_EDGE = 1568
+    # Long edge for the second pass on pages that came back (nearly) empty
+    # or with unclear passages
+    UPGRADE_EDGE = 2400
+    UPGRADE_MIN_CHARS = 20
+    # Cleanups shorter than this fraction of their input probably dropped
+    # content and are redone on the OCR model
+    CLEANUP_MIN_RATIO = 0.8
+    # Estimated input tokens of page text per batched cleanup request,
+    # and the output allowance for such a request
+    CLEANUP_BATCH_TOKENS = 6000
+    CLEANUP_BATCH_MAX_TOKENS = 16384
+    # Near-uniform, near-white pages are treated as blank and never sent
+    BLANK_MAX_STDDEV = 3.0
+    BLANK_MIN_MEAN = 240
+
+    # Rough prompt overhead, image cost and reply size for token estimates
+    PROMPT_TOKENS = 400
+    MAX_IMAGE_TOKENS = 1600
+    OUTPUT_TOKENS = 1000
+
     def __init__(
         self,
         model: Optional[str] = None,
-        client: Optional["anthropic.Anthropic"] = None
+        client: Optional["anthropic.Anthropic"] = None,
+        async_client: Optional["anthropic.AsyncAnthropic"] = None,
+        rpm: Optional[int] = None,
+        itpm: Optional[int] = None,
+        otpm: Optional[int] = None,
+        use_cache: bool = True,
+        jpeg_quality: int = 85,
+        max_edge: int = MAX_EDGE
     ):
         """
         Initialize the Claude engine.
@@ -42,18 +326,59 @@ class ClaudeEngine(OCREngine):
         Args:
             model: Claude model to use (default from config)
             client: Pre-configured Anthropic client (creates one if not provided)
+            async_client: Pre-configured async client for batch processing
+            rpm: Requests per minute limit (default from tier)
+            itpm: Input tokens per minute limit (default from tier)
+            otpm: Output tokens per minute limit (default from tier)
+            use_cache: Reuse results for identical images/text from the
+                       cache in CACHE_DIR
+            jpeg_quality: JPEG quality for uploads (0 to always send PNG)
+            max_edge: Downscale images so the long edge fits this size
         """
         self.model = model or ClaudeModels.DEFAULT
         self._client = client
+        self._async_client = async_client
+        self._rate_limiter = ClaudeRateLimiter(
+            rpm or TierConfig.get_rpm(),
+            itpm or TierConfig.get_input_tpm(),
+            otpm or TierConfig.get_output_tpm()
+        )
+        self.use_cache = use_cache
+        self.jpeg_quality = jpeg_quality
+        self.max_edge = max_edge
+
+        # Pages OCR'd and pages that needed the high-resolution retry
+        self.pages_processed = 0
+        self.pages_upgraded = 0
+        # Pages skipped as blank without an API call
+        self.pages_blank = 0
+        # Cleanups run and cleanups redone on the OCR model
+        self.cleanups_run = 0
+        self.cleanups_escalated = 0
+        self._result_cache: Optional[ResultCache] = None
 
     @property
     def client(self) -> "anthropic.Anthropic":
-        """Lazily initialize the Anthropic client."""
-        if self._client is None:
-            if not self.is_available():
-                raise OCRError("Anthropic library not installed")
-            self._client = anthropic.Anthropic()
-        return self._client
+        """Get the Anthropic client (the shared one unless injected)."""
+        if self._client is not None:
+            return self._client
+        if not self.is_available():
+            raise OCRError("Anthropic library not installed")
+        return _shared_client()
+
+    @property
+    def async_client(self) -> "anthropic.AsyncAnthropic":
+        """Get the async client (shared per event loop unless injected)."""
+        if self._async_client is not None:
+            return self._async_client
+        if not self.is_available():
+            raise OCRError("Anthropic library not installed")
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Outside a loop there is nothing to share the client with
+            return anthropic.AsyncAnthropic(max_retries=0)
+        return _shared_async_client(loop)
 
     @property
     def name(self) -> str:
@@ -66,61 +391,198 @@ class ClaudeEngine(OCREngine):
     def is_available(self) -> bool:
         return CLAUDE_AVAILABLE
 
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """Lazily open the result cache (None if disabled or unusable)."""
+        if self.use_cache and self._result_cache is None:
+            try:
+                self._result_cache = ResultCache(
+                    CACHE_DIR / "claude" / "results.sqlite"
+                )
+            except Exception:
+                self.use_cache = False
+        return self._result_cache
+
+    def _ocr_cache_key(self, image_bytes: bytes, lang: str, reflow: bool) -> str:
+        """Cache key for an OCR request."""
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        return f"ocr|{digest}|{lang}|{int(reflow)}|{self.model}|{_PROMPT_VERSION}"
+
     @staticmethod
-    def image_to_base64(image: Image.Image) -> str:
-        """Convert PIL Image to base64 string."""
+    def _cleanup_cache_key(text: str, lang: str, model: str) -> str:
+        """Cache key for a cleanup request."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"cleanup|{digest}|{lang}|{model}|{_PROMPT_VERSION}"
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Look up a cached result."""
+        cache = self.result_cache
+        return cache.get(key) if cache is not None else None
+
+    def _cache_put(self, key: str, text: str) -> None:
+        """Store a result, ignoring cache write errors."""
+        cache = self.result_cache
+        if cache is not None:
+            try:
+                cache.put(key, text)
+            except Exception:
+                pass
+
+    def image_to_bytes(self, image: Image.Image) -> Tuple[bytes, str]:
+        """
+        Encode a PIL Image for upload.
+
+        Scans are sent as JPEG, which encodes several times faster than
+        PNG and gives a much smaller payload. Bilevel (binarized) images
+        stay PNG: they compress well losslessly and JPEG would blur the
+        glyph edges.
+
+        Args:
+            image: PIL Image to encode
+
+        Returns:
+            Tuple of (encoded bytes, media type)
+        """
+        buffer, media_type = self._encode_image(image)
+        return buffer.getvalue(), media_type
+
+    def _encode_image(self, image: Image.Image) -> Tuple[io.BytesIO, str]:
+        """Encode a PIL Image into a buffer (see image_to_bytes)."""
         buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
-        return base64.standard_b64encode(buffer.getvalue()).decode("utf-8")
+        if image.mode == "1" or not self.jpeg_quality:
+            image.save(buffer, format="PNG")
+            return buffer, "image/png"
+
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(buffer, format="JPEG", quality=self.jpeg_quality)
+        return buffer, "image/jpeg"
+
+    @staticmethod
+    def fit_image(image: Image.Image, max_edge: int) -> Image.Image:
+        """Downscale an image so its long edge is at most ``max_edge``."""
+        width, height = image.size
+        long_edge = max(width, height)
+        if long_edge <= max_edge:
+            return image
+        scale = max_edge / long_edge
+        return image.resize(
+            (max(1, round(width * scale)), max(1, round(height * scale))),
+            Image.Resampling.LANCZOS
+        )
+
+    def _needs_upgrade(self, text: str, image: Image.Image) -> bool:
+        """Check whether a page should be retried at higher resolution."""
+        if max(image.size) <= self.max_edge:
+            return False
+        return (len(text.strip()) < self.UPGRADE_MIN_CHARS
+                or "[unclear]" in text)
+
+    @property
+    def upgrade_rate(self) -> float:
+        """Fraction of pages that needed the high-resolution retry."""
+        if not self.pages_processed:
+            return 0.0
+        return self.pages_upgraded / self.pages_processed
+
+    @classmethod
+    def is_blank(cls, image: Image.Image) -> bool:
+        """Whether a page is (nearly) blank: low pixel variance, light."""
+        stat = ImageStat.Stat(image.convert("L"))
+        return (stat.stddev[0] < cls.BLANK_MAX_STDDEV
+                and stat.mean[0] > cls.BLANK_MIN_MEAN)
 
-    def _build_ocr_prompt(self, lang: str, reflow: bool) -> str:
+    def _needs_escalation(self, text: str, cleaned: str, model: str) -> bool:
+        """Whether a cleanup came back short enough to redo on self.model."""
+        return (model != self.model
+                and len(cleaned.strip())
+                < self.CLEANUP_MIN_RATIO * len(text.strip()))
+
+    @property
+    def escalation_rate(self) -> float:
+        """Fraction of cleanups that were redone on the OCR model."""
+        if not self.cleanups_run:
+            return 0.0
+        return self.cleanups_escalated / self.cleanups_run
+
+    def image_to_base64(self, image: Image.Image) -> str:
+        """Convert PIL Image to base64 string."""
+        buffer, _ = self._encode_image(image)
+        # Encode straight from the buffer rather than a copy of it
+        return _b64encode(buffer.getbuffer())
+
+    def _build_ocr_prompt(self, lang: str, reflow: bool) -> Tuple[str, str]:
         """
         Build the OCR prompt based on settings.
 
+        The instructions are identical for every page and are sent as a
+        cached system block; only the short language line varies.
+
         Args:
             lang: Language code
             reflow: Whether to reflow text into paragraphs
 
         Returns:
-            Prompt string for Claude
+            Tuple of (static instructions, per-request prompt)
         """
-        lang_name = LANGUAGE_NAMES.get(lang, lang)
+        instructions = OCR_REFLOW_INSTRUCTIONS if reflow else OCR_INSTRUCTIONS
+        prompt = f"""This is a scanned document in {get_language_name(lang)}.
 
-        if reflow:
-            return f"""Transcribe ALL the text from this scanned document image.
+Output ONLY the transcribed text:"""
+        return instructions, prompt
 
-Instructions:
-- This is a scanned document in {lang_name}
-- Transcribe every word, number, and punctuation mark exactly as shown
-- REFLOW the text into logical paragraphs - do NOT preserve the original line breaks
-- Join lines that are part of the same sentence or paragraph into flowing text
-- Start new paragraphs only where there is a logical break (new section, new topic, numbered clauses like "PRIMERO:", "SEGUNDO:", etc.)
-- Preserve section headers and numbered items on their own lines
-- If text is faded or unclear, make your best interpretation based on context
-- Ignore any highlighter marks, stamps, or non-text elements
-- Do NOT add any commentary, notes, or headers - only output the transcribed text
-- Do NOT add titles like "TRANSCRIBED TEXT", "DOCUMENTO TRANSCRITO", or similar
-- Do NOT translate - keep the original language
-- Start directly with the document content
+    @staticmethod
+    def _cached_system(instructions: str) -> List[Dict[str, Any]]:
+        """Wrap static instructions in a prompt-cached system block."""
+        return [
+            {
+                "type": "text",
+                "text": instructions,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
 
-Output ONLY the transcribed text:"""
-        else:
-            return f"""Transcribe ALL the text from this scanned document image exactly as it appears.
+    @staticmethod
+    def _base64_source(image_bytes: bytes, media_type: str) -> Dict[str, Any]:
+        """Build an inline base64 image source block."""
+        return {
+            "type": "base64",
+            "media_type": media_type,
+            "data": _b64encode(image_bytes),
+        }
 
-Instructions:
-- This is a scanned document in {lang_name}
-- Transcribe every word, number, and punctuation mark exactly as shown
-- Preserve the original paragraph structure
-- If text is faded or unclear, make your best interpretation based on context
-- Ignore any highlighter marks, stamps, or non-text elements
-- Do NOT add any commentary, notes, or headers - only output the transcribed text
-- Do NOT add titles like "TRANSCRIBED TEXT", "DOCUMENTO TRANSCRITO", or similar
-- Do NOT translate - keep the original language
-- Start directly with the document content
+    def _ocr_messages(
+        self,
+        source: Dict[str, Any],
+        prompt: str
+    ) -> List[Dict[str, Any]]:
+        """Build the messages payload for an OCR request."""
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image",
+                        "source": source,
+                    },
+                    {
+                        "type": "text",
+                        "text": prompt,
+                    }
+                ],
+            }
+        ]
 
-Output ONLY the transcribed text:"""
+    def _estimate_image_tokens(self, image_bytes: bytes) -> int:
+        """Estimate input tokens for an image (~750 pixels per token)."""
+        try:
+            # Only reads the header
+            width, height = Image.open(io.BytesIO(image_bytes)).size
+        except Exception:
+            return self.MAX_IMAGE_TOKENS
+        return min(width * height // 750, self.MAX_IMAGE_TOKENS)
 
-    def _build_cleanup_prompt(self, text: str, lang: str) -> str:
+    def _build_cleanup_prompt(self, text: str, lang: str) -> Tuple[str, str]:
         """
         Build the cleanup prompt.
 
@@ -129,26 +591,17 @@ Output ONLY the transcribed text:"""
             lang: Language code
 
         Returns:
-            Cleanup prompt string
+            Tuple of (static rules, per-request prompt with the text)
         """
-        lang_name = LANGUAGE_NAMES.get(lang, lang)
-
-        return f"""Clean up this OCR-transcribed text in {lang_name}. Fix obvious errors while preserving the EXACT meaning and structure.
+        lang_name = get_language_name(lang)
 
-Rules:
-- Fix character recognition errors (e.g., "rn" that should be "m", "1" that should be "l")
-- Fix broken words and sentences
-- Fix punctuation and accents
-- Preserve ALL original content - do not add, remove, or paraphrase anything
-- Keep the same paragraph structure
-- If unsure about a word, keep the original
-- Do NOT translate or summarize
-- Do NOT add any commentary
+        prompt = f"""Clean up this OCR-transcribed text in {lang_name}.
 
 Original text:
 {text}
 
 Cleaned text:"""
+        return CLEANUP_INSTRUCTIONS, prompt
 
     def process_image(
         self,
@@ -160,6 +613,10 @@ Cleaned text:"""
         """
         Process an image with Claude Vision.
 
+        The image is downscaled to ``max_edge`` first. Blank pages return
+        "" without an API call. Pages that come back (nearly) empty or
+        with unclear passages are retried once at UPGRADE_EDGE.
+
         Args:
             image: PIL Image to process
             lang: Language code for the document
@@ -169,6 +626,55 @@ Cleaned text:"""
         Returns:
             Extracted text
 
+        Raises:
+            OCRError: If Claude API call fails
+        """
+        fitted = self.fit_image(image, self.max_edge)
+        if self.is_blank(fitted):
+            self.pages_blank += 1
+            return ""
+
+        image_bytes, media_type = self.image_to_bytes(fitted)
+        text = self.process_image_bytes(
+            image_bytes, media_type, lang=lang, reflow=reflow, **kwargs
+        )
+        self.pages_processed += 1
+
+        if self._needs_upgrade(text, image):
+            self.pages_upgraded += 1
+            image_bytes, media_type = self.image_to_bytes(
+                self.fit_image(image, self.UPGRADE_EDGE)
+            )
+            text = self.process_image_bytes(
+                image_bytes, media_type, lang=lang, reflow=reflow, **kwargs
+            )
+
+        return text
+
+    def process_image_bytes(
+        self,
+        image_bytes: bytes,
+        media_type: str,
+        lang: str = "eng",
+        reflow: bool = False,
+        **kwargs
+    ) -> str:
+        """
+        Process already-encoded image bytes with Claude Vision.
+
+        Fast path for callers that already hold PNG/JPEG bytes: they are
+        uploaded as-is, without a decode/encode round-trip.
+
+        Args:
+            image_bytes: Encoded image
+            media_type: MIME type, e.g. "image/jpeg"
+            lang: Language code for the document
+            reflow: Whether to reflow text into paragraphs
+            **kwargs: Additional options (e.g., max_tokens)
+
+        Returns:
+            Extracted text
+
         Raises:
             OCRError: If Claude API call fails
         """
@@ -178,38 +684,31 @@ Cleaned text:"""
                 "Run: pip install anthropic"
             )
 
-        image_data = self.image_to_base64(image)
-        prompt = self._build_ocr_prompt(lang, reflow)
+        cache_key = self._ocr_cache_key(image_bytes, lang, reflow)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        instructions, prompt = self._build_ocr_prompt(lang, reflow)
         max_tokens = kwargs.get("max_tokens", 4096)
+        estimated = self._estimate_image_tokens(image_bytes) + self.PROMPT_TOKENS
 
         try:
-            message = self.client.messages.create(
+            text = self._create(
+                estimated,
                 model=self.model,
                 max_tokens=max_tokens,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "image/png",
-                                    "data": image_data,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt,
-                            }
-                        ],
-                    }
-                ],
+                system=self._cached_system(instructions),
+                messages=self._ocr_messages(
+                    self._base64_source(image_bytes, media_type), prompt
+                ),
             )
-            return message.content[0].text
         except Exception as e:
             raise OCRError(f"Claude API call failed: {e}")
 
+        self._cache_put(cache_key, text)
+        return text
+
     def cleanup_text(
         self,
         text: str,
@@ -219,6 +718,10 @@ Cleaned text:"""
         """
         Clean up OCR text using Claude.
 
+        Runs on the cheap cleanup model (ClaudeModels.CLEANUP) unless
+        another is given; a result much shorter than its input is redone
+        on the OCR model.
+
         Args:
             text: Raw OCR text
             lang: Language code
@@ -233,14 +736,39 @@ Cleaned text:"""
         if not self.is_available():
             raise OCRError("Anthropic library not installed")
 
-        prompt = self._build_cleanup_prompt(text, lang)
+        model = kwargs.get("model") or ClaudeModels.CLEANUP
         max_tokens = kwargs.get("max_tokens", 4096)
-        model = kwargs.get("model", self.model)
+        self.cleanups_run += 1
+
+        cleaned = self._cleanup_once(text, lang, model, max_tokens)
+        if self._needs_escalation(text, cleaned, model):
+            self.cleanups_escalated += 1
+            cleaned = self._cleanup_once(text, lang, self.model, max_tokens)
+        return cleaned
+
+    def _cleanup_once(
+        self,
+        text: str,
+        lang: str,
+        model: str,
+        max_tokens: int
+    ) -> str:
+        """Run one (cached) cleanup request on the given model."""
+        cache_key = self._cleanup_cache_key(text, lang, model)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        instructions, prompt = self._build_cleanup_prompt(text, lang)
+        # ~4 characters per token
+        estimated = (len(instructions) + len(prompt)) // 4
 
         try:
-            message = self.client.messages.create(
+            cleaned = self._create(
+                estimated,
                 model=model,
                 max_tokens=max_tokens,
+                system=self._cached_system(instructions),
                 messages=[
                     {
                         "role": "user",
@@ -248,10 +776,145 @@ Cleaned text:"""
                     }
                 ],
             )
-            return message.content[0].text
         except Exception as e:
             raise OCRError(f"Claude cleanup failed: {e}")
 
+        self._cache_put(cache_key, cleaned)
+        return cleaned
+
+    @classmethod
+    def split_cleanup_batches(
+        cls,
+        texts: Dict[int, str]
+    ) -> List[Dict[int, str]]:
+        """
+        Group consecutive pages into cleanup_batch-sized buckets.
+
+        Each bucket stays under CLEANUP_BATCH_TOKENS (~4 characters per
+        token); a larger page gets a bucket of its own.
+
+        Args:
+            texts: Raw text by page number
+
+        Returns:
+            Buckets of text by page number, in page order
+        """
+        buckets: List[Dict[int, str]] = []
+        bucket: Dict[int, str] = {}
+        size = 0
+        for page_num in sorted(texts):
+            tokens = len(texts[page_num]) // 4
+            if bucket and size + tokens > cls.CLEANUP_BATCH_TOKENS:
+                buckets.append(bucket)
+                bucket, size = {}, 0
+            bucket[page_num] = texts[page_num]
+            size += tokens
+        if bucket:
+            buckets.append(bucket)
+        return buckets
+
+    def cleanup_batch(
+        self,
+        texts: Dict[int, str],
+        lang: str = "eng",
+        **kwargs
+    ) -> Dict[int, str]:
+        """
+        Clean up several pages in one request.
+
+        Pages are sent between "--- PAGE n ---" markers and the reply is
+        split on the same markers. Pages that are cached are not sent;
+        pages missing from the reply are cleaned on their own. Short
+        results are escalated as in cleanup_text.
+
+        Args:
+            texts: Raw OCR text by page number
+            lang: Language code
+            **kwargs: Additional options (e.g., max_tokens, model)
+
+        Returns:
+            Cleaned text by page number
+
+        Raises:
+            OCRError: If cleanup fails
+        """
+        if not self.is_available():
+            raise OCRError("Anthropic library not installed")
+
+        model = kwargs.get("model") or ClaudeModels.CLEANUP
+        max_tokens = kwargs.get("max_tokens", self.CLEANUP_BATCH_MAX_TOKENS)
+        self.cleanups_run += len(texts)
+
+        cleaned: Dict[int, str] = {}
+        pending: Dict[int, str] = {}
+        for page_num, text in texts.items():
+            cached = self._cache_get(self._cleanup_cache_key(text, lang, model))
+            if cached is not None:
+                cleaned[page_num] = cached
+            else:
+                pending[page_num] = text
+
+        if len(pending) > 1:
+            prompt = self._build_cleanup_batch_prompt(pending, lang)
+            estimated = (len(CLEANUP_BATCH_INSTRUCTIONS) + len(prompt)) // 4
+            try:
+                reply = self._create(
+                    estimated,
+                    model=model,
+                    max_tokens=max_tokens,
+                    system=self._cached_system(CLEANUP_BATCH_INSTRUCTIONS),
+                    messages=[{"role": "user", "content": prompt}],
+                )
+            except Exception as e:
+                raise OCRError(f"Claude cleanup failed: {e}")
+
+            for page_num, text in self._split_pages(reply).items():
+                if page_num in pending and text:
+                    cleaned[page_num] = text
+                    self._cache_put(
+                        self._cleanup_cache_key(pending[page_num], lang, model),
+                        text
+                    )
+
+        for page_num, text in texts.items():
+            if page_num not in cleaned:
+                cleaned[page_num] = self._cleanup_once(
+                    text, lang, model, kwargs.get("max_tokens", 4096)
+                )
+            if self._needs_escalation(text, cleaned[page_num], model):
+                self.cleanups_escalated += 1
+                cleaned[page_num] = self._cleanup_once(
+                    text, lang, self.model, kwargs.get("max_tokens", 4096)
+                )
+        return cleaned
+
+    def _build_cleanup_batch_prompt(
+        self,
+        texts: Dict[int, str],
+        lang: str
+    ) -> str:
+        """Build the prompt for cleanup_batch, one marker per page."""
+        lang_name = get_language_name(lang)
+        pages = "".join(
+            f"--- PAGE {page_num} ---\n{text}\n"
+            for page_num, text in texts.items()
+        )
+        return f"""Clean up these OCR-transcribed pages in {lang_name}.
+
+Original pages:
+{pages}
+Cleaned pages:"""
+
+    @staticmethod
+    def _split_pages(reply: str) -> Dict[int, str]:
+        """Split a cleanup_batch reply into text by page number."""
+        parts = _PAGE_MARKER_RE.split(reply)
+        # parts: [preamble, page, text, page, text, ...]
+        return {
+            int(page_num): text.strip("\n")
+            for page_num, text in zip(parts[1::2], parts[2::2])
+        }
+
     def process_with_cleanup(
         self,
         image: Image.Image,
@@ -269,7 +932,8 @@ Cleaned text:"""
             image: PIL Image to process
             lang: Language code
             reflow: Whether to reflow text
-            cleanup_model: Model to use for cleanup (defaults to same as OCR)
+            cleanup_model: Model to use for cleanup
+                           (default: ClaudeModels.CLEANUP)
             **kwargs: Additional options
 
         Returns:
@@ -278,9 +942,9 @@ Cleaned text:"""
         # Step 1: OCR
         raw_text = self.process_image(image, lang=lang, reflow=reflow, **kwargs)
 
-        # Step 2: Cleanup (if model provided)
+        # Step 2: Cleanup
         cleaned_text = None
-        if cleanup_model and raw_text:
+        if raw_text:
             cleaned_text = self.cleanup_text(
                 raw_text,
                 lang=lang,
@@ -289,3 +953,544 @@ Cleaned text:"""
             )
 
         return raw_text, cleaned_text
+
+    def _create(self, estimated_tokens: int, **params) -> str:
+        """
+        Send a request on the sync client with rate limiting and backoff.
+
+        Blocking variant of _create_async, drawing from the same rate
+        limiter.
+
+        Args:
+            estimated_tokens: Estimated input tokens for the request
+            **params: Arguments for messages.create
+
+        Returns:
+            Text of the first content block
+        """
+        estimated_output = min(params["max_tokens"], self.OUTPUT_TOKENS)
+
+        for attempt in range(MAX_RETRIES + 1):
+            self._rate_limiter.acquire_blocking(
+                1, estimated_tokens, estimated_output
+            )
+            try:
+                message = self.client.messages.create(**params)
+            except Exception as e:
+                delay = _retry_delay(e, attempt)
+                if delay is None or attempt == MAX_RETRIES:
+                    raise
+                time.sleep(delay)
+                continue
+
+            usage = getattr(message, "usage", None)
+            if usage is not None:
+                self._rate_limiter.record(
+                    estimated_tokens, usage.input_tokens,
+                    estimated_output,
+                    getattr(usage, "output_tokens", estimated_output)
+                )
+            return message.content[0].text
+
+    async def _create_async(self, estimated_tokens: int, **params) -> str:
+        """
+        Send a request on the async client with rate limiting and backoff.
+
+        Every attempt waits on the rate limiter (one request plus the
+        estimated tokens); 429/529 responses are retried with exponential
+        backoff (honoring Retry-After).
+
+        Args:
+            estimated_tokens: Estimated input tokens for the request
+            **params: Arguments for messages.create
+
+        Returns:
+            Text of the first content block
+        """
+        estimated_output = min(params["max_tokens"], self.OUTPUT_TOKENS)
+
+        for attempt in range(MAX_RETRIES + 1):
+            await self._rate_limiter.acquire(
+                1, estimated_tokens, estimated_output
+            )
+            try:
+                message = await self.async_client.messages.create(**params)
+            except Exception as e:
+                delay = _retry_delay(e, attempt)
+                if delay is None or attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            usage = getattr(message, "usage", None)
+            if usage is not None:
+                self._rate_limiter.record(
+                    estimated_tokens, usage.input_tokens,
+                    estimated_output,
+                    getattr(usage, "output_tokens", estimated_output)
+                )
+            return message.content[0].text
+
+    async def process_image_async(
+        self,
+        image: Image.Image,
+        lang: str = "eng",
+        reflow: bool = False,
+        **kwargs
+    ) -> str:
+        """
+        Async variant of process_image for batch processing.
+
+        Args:
+            image: PIL Image to process
+            lang: Language code for the document
+            reflow: Whether to reflow text into paragraphs
+            **kwargs: Additional options (e.g., max_tokens)
+
+        Returns:
+            Extracted text
+
+        Raises:
+            OCRError: If Claude API call fails
+        """
+        fitted = self.fit_image(image, self.max_edge)
+        if self.is_blank(fitted):
+            self.pages_blank += 1
+            return ""
+
+        image_bytes, media_type = self.image_to_bytes(fitted)
+        text = await self.process_image_bytes_async(
+            image_bytes, media_type, lang=lang, reflow=reflow, **kwargs
+        )
+        self.pages_processed += 1
+
+        if self._needs_upgrade(text, image):
+            self.pages_upgraded += 1
+            image_bytes, media_type = self.image_to_bytes(
+                self.fit_image(image, self.UPGRADE_EDGE)
+            )
+            text = await self.process_image_bytes_async(
+                image_bytes, media_type, lang=lang, reflow=reflow, **kwargs
+            )
+
+        return text
+
+    async def process_image_bytes_async(
+        self,
+        image_bytes: bytes,
+        media_type: str,
+        lang: str = "eng",
+        reflow: bool = False,
+        **kwargs
+    ) -> str:
+        """
+        Async variant of process_image_bytes.
+
+        Raises:
+            OCRError: If Claude API call fails
+        """
+        cache_key = self._ocr_cache_key(image_bytes, lang, reflow)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        instructions, prompt = self._build_ocr_prompt(lang, reflow)
+        estimated = self._estimate_image_tokens(image_bytes) + self.PROMPT_TOKENS
+
+        try:
+            text = await self._create_async(
+                estimated,
+                model=self.model,
+                max_tokens=kwargs.get("max_tokens", 4096),
+                system=self._cached_system(instructions),
+                messages=self._ocr_messages(
+                    self._base64_source(image_bytes, media_type), prompt
+                ),
+            )
+        except Exception as e:
+            raise OCRError(f"Claude API call failed: {e}")
+
+        self._cache_put(cache_key, text)
+        return text
+
+    async def cleanup_text_async(
+        self,
+        text: str,
+        lang: str = "eng",
+        **kwargs
+    ) -> str:
+        """
+        Async variant of cleanup_text for batch processing.
+
+        Args:
+            text: Raw OCR text
+            lang: Language code
+            **kwargs: Additional options (e.g., max_tokens, model)
+
+        Returns:
+            Cleaned text
+
+        Raises:
+            OCRError: If cleanup fails
+        """
+        model = kwargs.get("model") or ClaudeModels.CLEANUP
+        max_tokens = kwargs.get("max_tokens", 4096)
+        self.cleanups_run += 1
+
+        cleaned = await self._cleanup_once_async(text, lang, model, max_tokens)
+        if self._needs_escalation(text, cleaned, model):
+            self.cleanups_escalated += 1
+            cleaned = await self._cleanup_once_async(
+                text, lang, self.model, max_tokens
+            )
+        return cleaned
+
+    async def _cleanup_once_async(
+        self,
+        text: str,
+        lang: str,
+        model: str,
+        max_tokens: int
+    ) -> str:
+        """Async variant of _cleanup_once."""
+        cache_key = self._cleanup_cache_key(text, lang, model)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        instructions, prompt = self._build_cleanup_prompt(text, lang)
+        # ~4 characters per token
+        estimated = (len(instructions) + len(prompt)) // 4
+
+        try:
+            cleaned = await self._create_async(
+                estimated,
+                model=model,
+                max_tokens=max_tokens,
+                system=self._cached_system(instructions),
+                messages=[{"role": "user", "content": prompt}],
+            )
+        except Exception as e:
+            raise OCRError(f"Claude cleanup failed: {e}")
+
+        self._cache_put(cache_key, cleaned)
+        return cleaned
+
+    async def process_with_cleanup_async(
+        self,
+        image: Image.Image,
+        lang: str = "eng",
+        reflow: bool = False,
+        cleanup_model: Optional[str] = None,
+        **kwargs
+    ) -> tuple[str, Optional[str]]:
+        """
+        Async variant of process_with_cleanup.
+
+        Returns:
+            Tuple of (raw_text, cleaned_text)
+        """
+        raw_text = await self.process_image_async(
+            image, lang=lang, reflow=reflow, **kwargs
+        )
+
+        cleaned_text = None
+        if raw_text:
+            cleaned_text = await self.cleanup_text_async(
+                raw_text,
+                lang=lang,
+                model=cleanup_model,
+                **kwargs
+            )
+
+        return raw_text, cleaned_text
+
+    async def _process_one(
+        self,
+        page_num: int,
+        image: Image.Image,
+        semaphore: asyncio.Semaphore,
+        cleanup_semaphore: asyncio.Semaphore,
+        lang: str,
+        reflow: bool,
+        cleanup_model: Optional[str],
+        **kwargs
+    ) -> OCRResult:
+        """
+        OCR then clean up one page, capturing errors.
+
+        Each stage holds a slot only for its own request: the OCR slot is
+        released before cleanup starts, so the next page's OCR overlaps
+        this page's cleanup instead of waiting behind both round-trips.
+        """
+        try:
+            async with semaphore:
+                raw_text = await self.process_image_async(
+                    image, lang=lang, reflow=reflow, **kwargs
+                )
+
+            cleaned_text = None
+            if cleanup_model and raw_text:
+                async with cleanup_semaphore:
+                    cleaned_text = await self.cleanup_text_async(
+                        raw_text,
+                        lang=lang,
+                        model=cleanup_model,
+                        **kwargs
+                    )
+
+            return OCRResult(
+                page_num=page_num,
+                text=raw_text,
+                cleaned_text=cleaned_text
+            )
+        except Exception as e:
+            return OCRResult.failure(page_num, str(e))
+
+    async def iter_batch(
+        self,
+        pages: Sequence[Tuple[int, Image.Image]],
+        lang: str = "eng",
+        reflow: bool = False,
+        cleanup_model: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        cleanup_semaphore: Optional[asyncio.Semaphore] = None,
+        **kwargs
+    ) -> AsyncIterator[OCRResult]:
+        """
+        Process pages concurrently, yielding results as they finish.
+
+        OCR and cleanup are pipelined with separate limits, so cleanups
+        run alongside later pages' OCR rather than queueing behind it.
+
+        Args:
+            pages: (page_num, image) pairs
+            lang: Language code
+            reflow: Whether to reflow text
+            cleanup_model: Model to use for cleanup (None to skip)
+            concurrency: Limit per stage if no semaphores are given
+            semaphore: Shared OCR limit, e.g. across several documents
+            cleanup_semaphore: Shared cleanup limit
+            **kwargs: Additional options (e.g., max_tokens)
+
+        Yields:
+            OCRResult per page, in completion order
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(concurrency)
+        if cleanup_semaphore is None:
+            cleanup_semaphore = asyncio.Semaphore(concurrency)
+
+        tasks = [
+            self._process_one(
+                page_num, image, semaphore, cleanup_semaphore,
+                lang, reflow, cleanup_model, **kwargs
+            )
+            for page_num, image in pages
+        ]
+        for task in asyncio.as_completed(tasks):
+            yield await task
+
+    async def process_batch(
+        self,
+        pages: Sequence[Tuple[int, Image.Image]],
+        lang: str = "eng",
+        reflow: bool = False,
+        cleanup_model: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **kwargs
+    ) -> List[OCRResult]:
+        """
+        Process pages concurrently on the async client.
+
+        Args:
+            pages: (page_num, image) pairs
+            lang: Language code
+            reflow: Whether to reflow text
+            cleanup_model: Model to use for cleanup (None to skip)
+            concurrency: Maximum in-flight requests per stage
+            **kwargs: Additional options (e.g., max_tokens)
+
+        Returns:
+            OCRResult per page, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        cleanup_semaphore = asyncio.Semaphore(concurrency)
+        return list(await asyncio.gather(*[
+            self._process_one(
+                page_num, image, semaphore, cleanup_semaphore,
+                lang, reflow, cleanup_model, **kwargs
+            )
+            for page_num, image in pages
+        ]))
+
+    def _run_message_batch(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """
+        Submit a Message Batch and wait for it to end.
+
+        Args:
+            requests: Batch requests ({"custom_id", "params"})
+
+        Returns:
+            Text of each succeeded request by custom_id (errored, canceled
+            and expired requests are left out)
+        """
+        batch = self.client.messages.batches.create(requests=requests)
+        while batch.processing_status != "ended":
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        texts = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                texts[entry.custom_id] = entry.result.message.content[0].text
+        return texts
+
+    def process_batch_offline(
+        self,
+        pages: Sequence[Tuple[int, Image.Image]],
+        lang: str = "eng",
+        reflow: bool = False,
+        cleanup_model: Optional[str] = None,
+        **kwargs
+    ) -> List[OCRResult]:
+        """
+        Process pages through the Message Batches API.
+
+        For non-interactive bulk jobs: all pages go out as one batch
+        (and the cleanups as a second one), billed at the batch discount
+        and outside the online rate limits. Blocks until the batches
+        end, which can take minutes to hours. Cached pages are not
+        resubmitted.
+
+        Args:
+            pages: (page_num, image) pairs
+            lang: Language code
+            reflow: Whether to reflow text
+            cleanup_model: Model to use for cleanup (None to skip)
+            **kwargs: Additional options (e.g., max_tokens)
+
+        Returns:
+            OCRResult per page, in input order
+        """
+        if not self.is_available():
+            raise OCRError("Anthropic library not installed")
+
+        max_tokens = kwargs.get("max_tokens", 4096)
+        instructions, prompt = self._build_ocr_prompt(lang, reflow)
+
+        # OCR batch
+        raw_texts: Dict[int, str] = {}
+        cache_keys: Dict[int, str] = {}
+        requests = []
+        for page_num, image in pages:
+            fitted = self.fit_image(image, self.max_edge)
+            if self.is_blank(fitted):
+                self.pages_blank += 1
+                raw_texts[page_num] = ""
+                continue
+            image_bytes, media_type = self.image_to_bytes(fitted)
+            cache_key = self._ocr_cache_key(image_bytes, lang, reflow)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                raw_texts[page_num] = cached
+                continue
+            cache_keys[page_num] = cache_key
+            requests.append({
+                "custom_id": f"page_{page_num}",
+                "params": {
+                    "model": self.model,
+                    "max_tokens": max_tokens,
+                    "system": self._cached_system(instructions),
+                    "messages": self._ocr_messages(
+                        self._base64_source(image_bytes, media_type), prompt
+                    ),
+                },
+            })
+
+        if requests:
+            texts = self._run_message_batch(requests)
+            for page_num, cache_key in cache_keys.items():
+                text = texts.get(f"page_{page_num}")
+                if text is not None:
+                    raw_texts[page_num] = text
+                    self._cache_put(cache_key, text)
+        self.pages_processed += len(raw_texts)
+
+        # Cleanup batch, then redo short cleanups on the OCR model
+        cleaned_texts: Dict[int, str] = {}
+        if cleanup_model:
+            texts = {
+                page_num: raw_text
+                for page_num, raw_text in raw_texts.items() if raw_text
+            }
+            cleaned_texts = self._cleanup_batch_offline(
+                texts, lang, cleanup_model, max_tokens
+            )
+            self.cleanups_run += len(cleaned_texts)
+            short = {
+                page_num: texts[page_num]
+                for page_num, cleaned in cleaned_texts.items()
+                if self._needs_escalation(texts[page_num], cleaned, cleanup_model)
+            }
+            if short:
+                self.cleanups_escalated += len(short)
+                cleaned_texts.update(self._cleanup_batch_offline(
+                    short, lang, self.model, max_tokens
+                ))
+
+        results = []
+        for page_num, _ in pages:
+            if page_num in raw_texts:
+                results.append(OCRResult(
+                    page_num=page_num,
+                    text=raw_texts[page_num],
+                    cleaned_text=cleaned_texts.get(page_num)
+                ))
+            else:
+                results.append(OCRResult.failure(
+                    page_num, "Batch request did not succeed"
+                ))
+        return results
+
+    def _cleanup_batch_offline(
+        self,
+        texts: Dict[int, str],
+        lang: str,
+        model: str,
+        max_tokens: int
+    ) -> Dict[int, str]:
+        """Clean up raw texts by page number in one Message Batch."""
+        cleaned_texts: Dict[int, str] = {}
+        cache_keys: Dict[int, str] = {}
+        requests = []
+        for page_num, raw_text in texts.items():
+            cache_key = self._cleanup_cache_key(raw_text, lang, model)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                cleaned_texts[page_num] = cached
+                continue
+            instructions, prompt = self._build_cleanup_prompt(raw_text, lang)
+            cache_keys[page_num] = cache_key
+            requests.append({
+                "custom_id": f"clean_{page_num}",
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "system": self._cached_system(instructions),
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            })
+
+        if requests:
+            batch_texts = self._run_message_batch(requests)
+            for page_num, cache_key in cache_keys.items():
+                text = batch_texts.get(f"clean_{page_num}")
+                if text is not None:
+                    cleaned_texts[page_num] = text
+                    self._cache_put(cache_key, text)
+        return cleaned_texts
@@ -5,8 +5,8 @@ This module provides OCR using the free, open-source Tesseract engine.
 Best for clean scans with good contrast.
 """
 
-import re
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from PIL import Image
 
@@ -20,15 +20,58 @@ except ImportError:
     pytesseract = None
     TESSERACT_AVAILABLE = False
 
+# Optional in-process API - keeps the model loaded between pages
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    tesserocr = None
+    TESSEROCR_AVAILABLE = False
+
+
+@lru_cache(maxsize=64)
+def _resolve_language(lang: str, available: FrozenSet[str]) -> str:
+    """
+    Check a language spec against the installed languages (memoized).
+
+    The fallback warning is printed the first time a spec is resolved.
+    """
+    for l in lang.split("+"):
+        if l not in available:
+            print(f"⚠️  WARNING: Language '{l}' not available in Tesseract")
+            print(f"   Available: {', '.join(sorted(available))}")
+            if "eng" in available:
+                print("   Falling back to 'eng'...")
+                return "eng"
+            return min(available) if available else "eng"
+
+    return lang
+
 
 class TesseractEngine(OCREngine):
     """
     Tesseract OCR engine.
 
-    Uses pytesseract to interface with the Tesseract OCR engine.
-    Supports multiple languages, page segmentation modes, and auto-rotation.
+    Uses tesserocr when installed, which keeps the Tesseract API (and its
+    loaded language models) resident in-process, one per (lang, psm, oem).
+    Otherwise falls back to pytesseract, which starts a tesseract
+    subprocess per page. Supports multiple languages, page segmentation
+    modes, and auto-rotation.
+
+    Binary and language probes shell out to tesseract, so their results are
+    cached on the class for the lifetime of the process.
     """
 
+    # Longest edge of the copy that orientation detection runs on.
+    # Orientation is a page-wide property and OSD cost grows with the
+    # pixel count, but text much smaller than this stops being read.
+    OSD_MAX_DIM = 1600
+
+    # Process-wide probe caches (see clear_caches)
+    _binary_available: Optional[bool] = None
+    _available_languages: Optional[Tuple[str, ...]] = None
+    _language_set: Optional[FrozenSet[str]] = None
+
     def __init__(
         self,
         psm: int = 3,
@@ -50,6 +93,11 @@ class TesseractEngine(OCREngine):
         self.auto_rotate = auto_rotate
         self.rotate_confidence = rotate_confidence
 
+        # Resident tesserocr APIs by (lang, psm, oem)
+        self._apis: Dict[Tuple[str, int, int], "tesserocr.PyTessBaseAPI"] = {}
+        # Resident orientation-only API for detect_rotation
+        self._osd_api: Optional["tesserocr.PyTessBaseAPI"] = None
+
     @property
     def name(self) -> str:
         return "Tesseract"
@@ -59,16 +107,44 @@ class TesseractEngine(OCREngine):
         return True
 
     def is_available(self) -> bool:
-        return TESSERACT_AVAILABLE
+        """Check that tesserocr or pytesseract plus the binary work (cached)."""
+        cls = type(self)
+        if cls._binary_available is None:
+            if TESSEROCR_AVAILABLE:
+                cls._binary_available = True
+            elif not TESSERACT_AVAILABLE:
+                cls._binary_available = False
+            else:
+                try:
+                    pytesseract.get_tesseract_version()
+                    cls._binary_available = True
+                except Exception:
+                    cls._binary_available = False
+        return cls._binary_available
 
     def get_available_languages(self) -> List[str]:
-        """Get list of available Tesseract languages."""
-        if not self.is_available():
-            return ["eng"]
-        try:
-            return pytesseract.get_languages()
-        except Exception:
-            return ["eng"]
+        """Get list of available Tesseract languages (cached)."""
+        cls = type(self)
+        if cls._available_languages is None:
+            if not self.is_available():
+                return ["eng"]
+            try:
+                if TESSEROCR_AVAILABLE:
+                    _, languages = tesserocr.get_languages()
+                else:
+                    languages = pytesseract.get_languages()
+                cls._available_languages = tuple(languages)
+            except Exception:
+                return ["eng"]
+        return list(cls._available_languages)
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Forget cached binary and language probes (for tests)."""
+        cls._binary_available = None
+        cls._available_languages = None
+        cls._language_set = None
+        _resolve_language.cache_clear()
 
     def validate_language(self, lang: str) -> str:
         """
@@ -80,19 +156,14 @@ class TesseractEngine(OCREngine):
         Returns:
             Valid language specification
         """
-        available = self.get_available_languages()
-        langs_to_check = lang.split("+")
-
-        for l in langs_to_check:
-            if l not in available:
-                print(f"⚠️  WARNING: Language '{l}' not available in Tesseract")
-                print(f"   Available: {', '.join(sorted(available))}")
-                if "eng" in available:
-                    print("   Falling back to 'eng'...")
-                    return "eng"
-                return available[0] if available else "eng"
-
-        return lang
+        cls = type(self)
+        available = cls._language_set
+        if available is None:
+            available = frozenset(self.get_available_languages())
+            # Only keep it once the probe itself is cached
+            if cls._available_languages is not None:
+                cls._language_set = available
+        return _resolve_language(lang, available)
 
     def detect_rotation(
         self,
@@ -101,6 +172,9 @@ class TesseractEngine(OCREngine):
         """
         Detect and correct page orientation using Tesseract OSD.
 
+        OSD runs on a copy scaled down to OSD_MAX_DIM; the rotation is
+        applied to the full-resolution image.
+
         Args:
             image: PIL Image to analyze
 
@@ -110,33 +184,79 @@ class TesseractEngine(OCREngine):
         if not self.auto_rotate:
             return image, 0
 
-        try:
-            osd_output = pytesseract.image_to_osd(image)
+        if TESSEROCR_AVAILABLE:
+            return self._detect_rotation_resident(image)
 
-            # Parse rotation angle
-            rotate_match = re.search(r'Rotate:\s*(\d+)', osd_output)
-            confidence_match = re.search(
-                r'Orientation confidence:\s*([\d.]+)',
-                osd_output
+        try:
+            osd = pytesseract.image_to_osd(
+                self._osd_image(image), output_type=pytesseract.Output.DICT
             )
 
-            confidence = (
-                float(confidence_match.group(1))
-                if confidence_match else 0
-            )
+            angle = osd["rotate"]
+            if angle != 0 and osd["orientation_conf"] >= self.rotate_confidence:
+                image = image.rotate(-angle, expand=True)
+                return image, angle
 
-            if rotate_match:
-                angle = int(rotate_match.group(1))
-                if angle != 0 and confidence >= self.rotate_confidence:
-                    image = image.rotate(-angle, expand=True)
-                    return image, angle
+            return image, 0
 
+        except Exception:
+            # OSD can fail on poor quality images
             return image, 0
 
+    def _detect_rotation_resident(
+        self,
+        image: Image.Image
+    ) -> Tuple[Image.Image, int]:
+        """detect_rotation on a resident tesserocr OSD API (no subprocess)."""
+        try:
+            if self._osd_api is None:
+                self._osd_api = tesserocr.PyTessBaseAPI(
+                    lang="osd", psm=tesserocr.PSM.OSD_ONLY
+                )
+            self._osd_api.SetImage(self._osd_image(image))
+            osd = self._osd_api.DetectOrientationScript()
         except Exception:
             # OSD can fail on poor quality images
             return image, 0
 
+        if not osd:
+            return image, 0
+        # orient_deg is the detected orientation; the correction to apply
+        # (pytesseract's "rotate") is its complement, as Tesseract reports
+        angle = (360 - osd["orient_deg"]) % 360
+        if angle != 0 and osd["orient_conf"] >= self.rotate_confidence:
+            return image.rotate(-angle, expand=True), angle
+        return image, 0
+
+    def _osd_image(self, image: Image.Image) -> Image.Image:
+        """Scale an image down for orientation detection (never up)."""
+        longest = max(image.size)
+        if longest <= self.OSD_MAX_DIM:
+            return image
+        scale = self.OSD_MAX_DIM / longest
+        return image.resize(
+            (round(image.width * scale), round(image.height * scale)),
+            Image.Resampling.BILINEAR, reducing_gap=2.0
+        )
+
+    def _get_api(self, lang: str) -> "tesserocr.PyTessBaseAPI":
+        """Get the resident tesserocr API for a language, creating it once."""
+        key = (lang, self.psm, self.oem)
+        api = self._apis.get(key)
+        if api is None:
+            api = tesserocr.PyTessBaseAPI(lang=lang, psm=self.psm, oem=self.oem)
+            self._apis[key] = api
+        return api
+
+    def close(self) -> None:
+        """Release resident tesserocr APIs."""
+        for api in self._apis.values():
+            api.End()
+        self._apis.clear()
+        if self._osd_api is not None:
+            self._osd_api.End()
+            self._osd_api = None
+
     def process_image(
         self,
         image: Image.Image,
@@ -165,6 +285,15 @@ class TesseractEngine(OCREngine):
                 "Install: pip install pytesseract && brew install tesseract"
             )
 
+        # In-process fast path (extra CLI config needs the subprocess)
+        if TESSEROCR_AVAILABLE and "config" not in kwargs:
+            try:
+                api = self._get_api(lang)
+                api.SetImage(image)
+                return api.GetUTF8Text()
+            except Exception as e:
+                raise OCRError(f"Tesseract processing failed: {e}")
+
         # Build config string
         config = f"--psm {self.psm} --oem {self.oem}"
 
@@ -178,6 +307,31 @@ class TesseractEngine(OCREngine):
         except Exception as e:
             raise OCRError(f"Tesseract processing failed: {e}")
 
+    def process_images(
+        self,
+        images: List[Image.Image],
+        lang: str = "eng",
+        **kwargs
+    ) -> List[str]:
+        """
+        Process several images with one resident engine.
+
+        With tesserocr the language model is loaded once for the whole
+        batch instead of once per page.
+
+        Args:
+            images: PIL Images to process
+            lang: Tesseract language code
+            **kwargs: Additional Tesseract config options
+
+        Returns:
+            Extracted text per image, in order
+
+        Raises:
+            OCRError: If Tesseract is not available or fails
+        """
+        return [self.process_image(image, lang=lang, **kwargs) for image in images]
+
     def process_with_rotation(
         self,
         image: Image.Image,
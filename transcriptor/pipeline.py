@@ -8,20 +8,27 @@ Coordinates the OCR processing pipeline, handling:
 - Progress reporting
 """
 
+import asyncio
 import os
+import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import (
+    Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+)
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
 
 from PIL import Image
 
-from transcriptor.config import Config, Engine, TierConfig
-from transcriptor.engines.base import OCREngine, OCRResult
+from transcriptor.config import Config, Engine, PreprocessMode, TierConfig
+from transcriptor.engines.base import OCREngine, OCRError, OCRResult
 from transcriptor.engines.tesseract import TesseractEngine
 from transcriptor.engines.claude import ClaudeEngine
 from transcriptor.processors.image import ImageProcessor
 from transcriptor.processors.text import TextProcessor
+from transcriptor.utils.cache import OCRCache, config_hash, hash_file
 from transcriptor.utils.pdf import PDFUtils, PDFError
 
 
@@ -33,17 +40,41 @@ class Pipeline:
     handling engine selection, parallel processing, and result assembly.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, engine: Optional[OCREngine] = None):
         """
         Initialize the pipeline with configuration.
 
         Args:
             config: Configuration object with all settings
+            engine: Pre-built, already validated OCR engine to share
+                    across pipelines (created from config if not provided)
         """
         self.config = config
-        self.image_processor = ImageProcessor(config.binarize_threshold)
+        self.image_processor = ImageProcessor(
+            config.binarize_threshold, config.max_dim
+        )
         self.text_processor = TextProcessor()
-        self._engine: Optional[OCREngine] = None
+        self._engine: Optional[OCREngine] = engine
+        self._engine_validated = engine is not None
+
+        # Claude engine for Tesseract cleanup, created on first use; a
+        # failed validation is remembered so it isn't retried every run
+        self._cleanup_engine: Optional[ClaudeEngine] = None
+        self._cleanup_error: Optional[str] = None
+
+        # Worker threads shared by the phases of a run (see pool)
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # Claude runs stream pages to this folder and keep only page
+        # numbers plus running text statistics (see _handle_claude_result)
+        self._pages_folder: Optional[Path] = None
+        self._characters = 0
+        self._words = 0
+
+        # Page cache, opened in _prepare() when enabled
+        self._cache: Optional[OCRCache] = None
+        self._pdf_hash = ""
+        self._config_hash = ""
 
     @property
     def engine(self) -> OCREngine:
@@ -52,10 +83,63 @@ class Pipeline:
             self._engine = self._create_engine()
         return self._engine
 
+    @property
+    def cleanup_engine(self) -> ClaudeEngine:
+        """
+        Lazily create, validate and return the engine for AI cleanup.
+
+        The Claude OCR engine is reused when there is one.
+
+        Raises:
+            OCRError: If the engine is unavailable (cached after the
+                      first failure)
+        """
+        if self._cleanup_engine is None:
+            if self._cleanup_error is not None:
+                raise OCRError(self._cleanup_error)
+            if isinstance(self._engine, ClaudeEngine):
+                self._cleanup_engine = self._engine
+            else:
+                engine = ClaudeEngine(
+                    model=self.config.claude_model,
+                    use_cache=self.config.use_cache
+                )
+                try:
+                    engine.validate()
+                except Exception as e:
+                    self._cleanup_error = str(e)
+                    raise
+                self._cleanup_engine = engine
+        return self._cleanup_engine
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """
+        Lazily create and return the thread pool shared across phases.
+
+        Page prefetching and the cleanup pass reuse the same threads
+        instead of each starting and tearing down a pool. Released by
+        close() at the end of each run.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max(self.config.effective_workers, self.config.workers)
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the shared thread pool (recreated on next use)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
     def _create_engine(self) -> OCREngine:
         """Create the appropriate OCR engine based on config."""
-        if self.config.engine == Engine.CLAUDE:
-            return ClaudeEngine(model=self.config.claude_model)
+        if self.config.engine is Engine.CLAUDE:
+            return ClaudeEngine(
+                model=self.config.claude_model,
+                use_cache=self.config.use_cache
+            )
         else:
             return TesseractEngine(
                 psm=self.config.psm,
@@ -76,14 +160,18 @@ class Pipeline:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        # Check engine availability
-        self.engine.validate()
+        # Check engine availability (shared engines are validated once)
+        if not self._engine_validated:
+            self.engine.validate()
+            self._engine_validated = True
 
         # Validate language for Tesseract
-        if self.config.engine == Engine.TESSERACT:
+        if self.config.engine is Engine.TESSERACT:
             tesseract = self.engine
             if isinstance(tesseract, TesseractEngine):
-                self.config.lang = tesseract.validate_language(self.config.lang)
+                lang = tesseract.validate_language(self.config.lang)
+                if lang != self.config.lang:
+                    self.config = replace(self.config, lang=lang)
 
     def run(self) -> Path:
         """
@@ -92,7 +180,78 @@ class Pipeline:
         Returns:
             Path to the output file
         """
+        pdf_path, output_path, pages_to_process = self._prepare()
+
+        # Start timing
+        start_time = time.time()
+
+        # Process based on engine type
+        if self.config.engine is Engine.CLAUDE:
+            results, cleaned_results = self._process_with_claude(
+                pdf_path, pages_to_process
+            )
+        else:
+            results, cleaned_results = self._process_with_tesseract(
+                pdf_path, pages_to_process
+            )
+
+        return self._finish(
+            pdf_path, output_path, results, cleaned_results,
+            time.time() - start_time
+        )
+
+    async def run_async(
+        self,
+        semaphore: asyncio.Semaphore,
+        cleanup_semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Path:
+        """
+        Execute the pipeline on the async Claude client.
+
+        Used for batch runs where several pipelines share one engine and
+        one semaphore per stage, so the tier's concurrency is spread
+        across all pages of all PDFs instead of being applied per PDF.
+
+        Args:
+            semaphore: Shared limit on in-flight OCR requests
+            cleanup_semaphore: Shared limit on in-flight cleanup requests
+
+        Returns:
+            Path to the output file
+        """
+        if self.config.engine is not Engine.CLAUDE:
+            raise RuntimeError("Async pipeline requires the Claude engine")
+
+        pdf_path, output_path, pages_to_process = await asyncio.to_thread(
+            self._prepare
+        )
+
+        start_time = time.time()
+        if self.config.offline_batch:
+            results, cleaned_results = await asyncio.to_thread(
+                self._process_with_claude_offline, pdf_path, pages_to_process
+            )
+        else:
+            results, cleaned_results = await self._process_with_claude_async(
+                pdf_path, pages_to_process, semaphore, cleanup_semaphore
+            )
+
+        return await asyncio.to_thread(
+            self._finish, pdf_path, output_path, results, cleaned_results,
+            time.time() - start_time
+        )
+
+    def _prepare(self) -> Tuple[Path, Path, List[int]]:
+        """
+        Validate the config and work out what to process.
+
+        Returns:
+            Tuple of (pdf_path, output_path, pages_to_process)
+        """
         self.validate()
+        self._pages_folder = None
+        self._characters = 0
+        self._words = 0
 
         pdf_path = Path(self.config.pdf_path)
         output_path = self._get_output_path(pdf_path)
@@ -110,30 +269,121 @@ class Pipeline:
         pages_to_process = self._get_pages_to_process(total_pages)
         self._print_config(total_pages, pages_to_process)
 
-        # Start timing
-        start_time = time.time()
+        if self.config.use_cache:
+            self._open_cache(pdf_path, output_path)
 
-        # Process based on engine type
-        if self.config.engine == Engine.CLAUDE:
-            results, cleaned_results = self._process_with_claude(
-                pdf_path, pages_to_process
-            )
-        else:
-            results, cleaned_results = self._process_with_tesseract(
-                pdf_path, pages_to_process
+        return pdf_path, output_path, pages_to_process
+
+    def _open_cache(self, pdf_path: Path, output_path: Path) -> None:
+        """Open the page cache next to the output document."""
+        try:
+            self._pdf_hash = hash_file(pdf_path)
+            self._config_hash = config_hash(self.config)
+            self._cache = OCRCache(output_path.parent / ".cache" / "ocr.sqlite")
+        except Exception as e:
+            print(f"⚠️  Page cache disabled: {e}")
+            self._cache = None
+
+    def _take_cached(
+        self,
+        pages: List[int],
+        results: Union[Dict[int, str], Set[int]],
+        cleaned_results: Union[Dict[int, str], Set[int]],
+        require_cleaned: bool = False,
+        pages_folder: Optional[Path] = None
+    ) -> List[int]:
+        """
+        Fill results from the page cache.
+
+        Args:
+            pages: Pages to process
+            results: Raw text by page, updated in place
+            cleaned_results: Cleaned text by page, updated in place
+            require_cleaned: Treat entries without cleaned text as misses
+            pages_folder: If given, write cached pages there instead, and
+                          record only their numbers in the results sets
+
+        Returns:
+            Pages that still need processing
+        """
+        if self._cache is None:
+            return pages
+
+        remaining = []
+        for page_num in pages:
+            entry = self._cache.get(self._pdf_hash, page_num, self._config_hash)
+            if entry is None or (require_cleaned and entry[1] is None):
+                remaining.append(page_num)
+                continue
+
+            text, cleaned_text = entry
+            if cleaned_text is not None and not self.config.cleanup:
+                cleaned_text = None
+            if pages_folder is not None:
+                self._save_claude_page(
+                    pages_folder, page_num, text, cleaned_text,
+                    results, cleaned_results
+                )
+                continue
+
+            results[page_num] = text
+            if cleaned_text is not None:
+                cleaned_results[page_num] = cleaned_text
+
+        cached = len(pages) - len(remaining)
+        if cached:
+            print(f"   💾 {cached} page(s) loaded from cache")
+        return remaining
+
+    def _cache_put(
+        self,
+        page_num: int,
+        text: str,
+        cleaned_text: Optional[str] = None
+    ) -> None:
+        """Store a page in the cache, if enabled."""
+        if self._cache is None:
+            return
+        try:
+            self._cache.put(
+                self._pdf_hash, page_num, self._config_hash, text, cleaned_text
             )
+        except Exception as e:
+            print(f"   ⚠️  Could not cache page {page_num}: {e}")
 
-        # Calculate elapsed time
-        elapsed_time = time.time() - start_time
+    def _finish(
+        self,
+        pdf_path: Path,
+        output_path: Path,
+        results: Union[Dict[int, str], Set[int]],
+        cleaned_results: Union[Dict[int, str], Set[int]],
+        elapsed_time: float
+    ) -> Path:
+        """
+        Save the documents and print statistics.
+
+        Results are text by page, or just page numbers when the pages
+        were streamed to a pages folder (Claude).
+        """
+        self.close()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+        if self._pages_folder is None:
+            stats = self.text_processor.get_statistics_iter(results.values())
+            characters, words = stats["characters"], stats["words"]
+        else:
+            # As if the page texts were joined with newlines
+            characters = self._characters + max(len(results) - 1, 0)
+            words = self._words
 
-        # Build and save documents
         output_path = self._save_documents(
             pdf_path, output_path, results, cleaned_results
         )
-
-        # Print statistics
-        self._print_statistics(results, output_path, elapsed_time)
-
+        self._print_statistics(
+            len(results), characters, words, output_path, elapsed_time
+        )
         return output_path
 
     def _get_output_path(self, pdf_path: Path) -> Path:
@@ -149,14 +399,17 @@ class Pipeline:
 
     def _get_pages_to_process(self, total_pages: int) -> List[int]:
         """Determine which pages to process."""
-        # Handle --first shortcut
-        page_spec = self.config.pages
-        if self.config.first_n and not page_spec:
-            page_spec = f"1-{self.config.first_n}"
-
-        if page_spec:
-            pages = PDFUtils.parse_page_range(page_spec, total_pages)
-            valid_pages = [p for p in pages if 1 <= p <= total_pages]
+        pages_set = self.config.pages_set
+        if pages_set is None:
+            # Config built without the CLI: parse the raw spec here
+            page_spec = self.config.pages
+            if self.config.first_n and not page_spec:
+                page_spec = f"1-{self.config.first_n}"
+            if page_spec:
+                pages_set = PDFUtils.parse_page_range(page_spec, total_pages)
+
+        if pages_set is not None:
+            valid_pages = sorted(p for p in pages_set if 1 <= p <= total_pages)
             if not valid_pages:
                 raise ValueError(
                     f"No valid pages in range. Document has {total_pages} pages."
@@ -169,113 +422,262 @@ class Pipeline:
         self,
         pdf_path: Path,
         pages: List[int]
-    ) -> Tuple[Dict[int, str], Dict[int, str]]:
+    ) -> Tuple[Set[int], Set[int]]:
         """
         Process pages using Claude Vision.
 
-        Uses ThreadPoolExecutor for parallel API calls.
+        Runs the async path with the tier's concurrency so pages are
+        in flight together rather than one blocking call per thread.
         """
-        results = {}
-        cleaned_results = {}
+        if self.config.offline_batch:
+            return self._process_with_claude_offline(pdf_path, pages)
 
-        max_workers = self.config.effective_workers
-        do_cleanup = self.config.cleanup
+        semaphore = asyncio.Semaphore(self.config.effective_workers)
+        cleanup_semaphore = asyncio.Semaphore(self.config.effective_workers)
+        return asyncio.run(self._process_with_claude_async(
+            pdf_path, pages, semaphore, cleanup_semaphore
+        ))
+
+    async def _process_with_claude_async(
+        self,
+        pdf_path: Path,
+        pages: List[int],
+        semaphore: asyncio.Semaphore,
+        cleanup_semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Tuple[Set[int], Set[int]]:
+        """
+        Process pages using Claude Vision on the async client.
+
+        Every page is a task; its OCR and cleanup requests are gated by
+        the shared per-stage semaphores.
+
+        Pages are converted CLAUDE_CHUNK_PAGES at a time as a rolling
+        queue: a chunk is converted while earlier ones are in flight, and
+        only enough chunks to fill the concurrency limit are held in
+        memory at once, rather than every page image of the document.
+        Page texts are streamed to the pages folder; only the numbers of
+        the finished pages are returned.
+        """
+        results = set()
+        cleaned_results = set()
+
+        pages, pages_folder = await asyncio.to_thread(
+            self._start_claude_pages, pdf_path, pages,
+            results, cleaned_results
+        )
+        print(f"   🔄 Processing {len(pages)} pages...")
+
+        # One chunk beyond what the concurrency limit can keep busy
+        chunk_slots = asyncio.Semaphore(
+            -(-self.config.effective_workers // CLAUDE_CHUNK_PAGES) + 1
+        )
+        tasks = []
+        for i in range(0, len(pages), CLAUDE_CHUNK_PAGES):
+            await chunk_slots.acquire()
+            try:
+                processed_images = await asyncio.to_thread(
+                    self._convert_claude_pages,
+                    pdf_path, pages[i:i + CLAUDE_CHUNK_PAGES]
+                )
+            except Exception:
+                chunk_slots.release()
+                raise
+            task = asyncio.create_task(self._process_claude_chunk(
+                processed_images, pages_folder, results, cleaned_results,
+                semaphore, cleanup_semaphore
+            ))
+            task.add_done_callback(lambda _: chunk_slots.release())
+            tasks.append(task)
+            del processed_images
+        await asyncio.gather(*tasks)
+
+        return results, cleaned_results
+
+    async def _process_claude_chunk(
+        self,
+        processed_images: List[Tuple[int, Image.Image]],
+        pages_folder: Path,
+        results: Set[int],
+        cleaned_results: Set[int],
+        semaphore: asyncio.Semaphore,
+        cleanup_semaphore: Optional[asyncio.Semaphore]
+    ) -> None:
+        """OCR (and clean up) one chunk of pages, saving each as it lands."""
+        claude_engine = self._claude_engine()
+        cleanup_model = self.config.cleanup_model if self.config.cleanup else None
+
+        async for result in claude_engine.iter_batch(
+            processed_images,
+            lang=self.config.lang,
+            reflow=self.config.reflow,
+            cleanup_model=cleanup_model,
+            concurrency=self.config.effective_workers,
+            semaphore=semaphore,
+            cleanup_semaphore=cleanup_semaphore
+        ):
+            try:
+                self._handle_claude_result(
+                    result, pages_folder, results, cleaned_results
+                )
+            except Exception as e:
+                print(f"   📝 Page {result.page_num}... ❌ ({e})")
+
+    def _process_with_claude_offline(
+        self,
+        pdf_path: Path,
+        pages: List[int]
+    ) -> Tuple[Set[int], Set[int]]:
+        """
+        Process pages using Claude Vision through the Message Batches API.
+
+        Blocks until the batch ends; results are written once it does.
+        """
+        results = set()
+        cleaned_results = set()
+
+        pages, pages_folder = self._start_claude_pages(
+            pdf_path, pages, results, cleaned_results
+        )
+        processed_images = self._convert_claude_pages(pdf_path, pages)
+        print(f"   🔄 Processing {len(processed_images)} pages...")
+        if not processed_images:
+            return results, cleaned_results
+
+        claude_engine = self._claude_engine()
+        cleanup_model = self.config.cleanup_model if self.config.cleanup else None
+
+        print("   📨 Submitted as an offline batch, waiting for results...")
+        batch_results = claude_engine.process_batch_offline(
+            processed_images,
+            lang=self.config.lang,
+            reflow=self.config.reflow,
+            cleanup_model=cleanup_model
+        )
+        for result in batch_results:
+            try:
+                self._handle_claude_result(
+                    result, pages_folder, results, cleaned_results
+                )
+            except Exception as e:
+                print(f"   📝 Page {result.page_num}... ❌ ({e})")
+
+        return results, cleaned_results
+
+    def _start_claude_pages(
+        self,
+        pdf_path: Path,
+        pages: List[int],
+        results: Set[int],
+        cleaned_results: Set[int]
+    ) -> Tuple[List[int], Path]:
+        """
+        Announce a Claude run, create the pages folder and apply the cache.
+
+        Cached pages are written to the pages folder, recorded in
+        results/cleaned_results and skipped.
 
-        pipeline_mode = "OCR + cleanup" if do_cleanup else "OCR only"
+        Returns:
+            Tuple of (pages still to process, pages_folder)
+        """
+        pipeline_mode = "OCR + cleanup" if self.config.cleanup else "OCR only"
         print(f"\n🤖 Processing with Claude ({self.config.claude_model})"
               f"{self.config.mode_suffix}...")
         print(f"   ⚡ Pipeline: {pipeline_mode} | Tier {TierConfig.TIER} | "
-              f"{max_workers} concurrent requests")
-
-        # Convert pages to images
-        print(f"   📸 Converting PDF to images...")
-        page_images = PDFUtils.convert_pages(pdf_path, pages, self.config.dpi)
-        print(f"   ✓ Converted {len(page_images)} pages")
-
-        # Preprocess images
-        processed_images = []
-        for page_num, image in page_images:
-            image = self.image_processor.process(image, self.config.preprocess)
-            processed_images.append((page_num, image))
+              f"{self.config.effective_workers} concurrent requests")
 
         # Create output folder for streaming (pages subfolder)
         doc_folder = self._get_output_path(pdf_path).parent
         pages_folder = doc_folder / "pages"
         pages_folder.mkdir(parents=True, exist_ok=True)
+        self._pages_folder = pages_folder
         print(f"   📁 Streaming results to: {pages_folder}/")
 
-        # Process with thread pool
-        print(f"   🔄 Processing {len(processed_images)} pages...")
+        # Skip pages already in the cache
+        pages = self._take_cached(
+            pages, results, cleaned_results,
+            require_cleaned=self.config.cleanup, pages_folder=pages_folder
+        )
+        return pages, pages_folder
+
+    def _convert_claude_pages(
+        self,
+        pdf_path: Path,
+        pages: List[int]
+    ) -> List[Tuple[int, Image.Image]]:
+        """Convert and preprocess pages for Claude."""
+        if not pages:
+            return []
+
+        print(f"   📸 Converting pages {pages[0]}-{pages[-1]} to images...")
+        page_images = PDFUtils.convert_pages_iter(
+            pdf_path, pages, self.config.dpi,
+            grayscale=self.config.render_grayscale,
+            thread_count=RENDER_THREADS,
+            max_long_edge=self.config.max_dim
+        )
+
+        # Preprocess as pages arrive so each raw render is dropped at once
+        return [
+            (page_num, self.image_processor.process(
+                image, self.config.preprocess
+            ))
+            for page_num, image in page_images
+        ]
 
+    def _claude_engine(self) -> ClaudeEngine:
+        """Return the engine, checking that it is a Claude engine."""
         claude_engine = self.engine
         if not isinstance(claude_engine, ClaudeEngine):
             raise RuntimeError("Expected Claude engine")
+        return claude_engine
 
-        cleanup_model = self.config.claude_model if do_cleanup else None
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {}
-            for page_num, image in processed_images:
-                future = executor.submit(
-                    self._process_claude_page,
-                    claude_engine,
-                    image,
-                    page_num,
-                    cleanup_model
-                )
-                futures[future] = page_num
-
-            for future in as_completed(futures):
-                page_num = futures[future]
-                try:
-                    result = future.result()
-                    if result.success:
-                        results[result.page_num] = result.text
-
-                        # Save raw page
-                        self.text_processor.save_page(
-                            pages_folder, result.page_num, result.text
-                        )
-
-                        status = "✓"
-                        if result.cleaned_text:
-                            cleaned_results[result.page_num] = result.cleaned_text
-                            self.text_processor.save_page(
-                                pages_folder, result.page_num,
-                                result.cleaned_text, "_clean"
-                            )
-                            status = "✓ +cleaned"
-
-                        print(f"   📝 Page {result.page_num}... {status}")
-                    else:
-                        print(f"   📝 Page {page_num}... ⚠️ (empty)")
-                except Exception as e:
-                    print(f"   📝 Page {page_num}... ❌ ({e})")
+    def _handle_claude_result(
+        self,
+        result: OCRResult,
+        pages_folder: Path,
+        results: Set[int],
+        cleaned_results: Set[int]
+    ) -> None:
+        """Record a finished Claude page and stream it to disk."""
+        if not result.success:
+            print(f"   📝 Page {result.page_num}... ⚠️ (empty)")
+            return
+
+        self._save_claude_page(
+            pages_folder, result.page_num, result.text,
+            result.cleaned_text or None, results, cleaned_results
+        )
+        status = "✓ +cleaned" if result.cleaned_text else "✓"
 
-        return results, cleaned_results
+        self._cache_put(result.page_num, result.text, result.cleaned_text)
+        print(f"   📝 Page {result.page_num}... {status}")
 
-    def _process_claude_page(
+    def _save_claude_page(
         self,
-        engine: ClaudeEngine,
-        image: Image.Image,
+        pages_folder: Path,
         page_num: int,
-        cleanup_model: Optional[str]
-    ) -> OCRResult:
-        """Process a single page with Claude."""
-        try:
-            raw_text, cleaned_text = engine.process_with_cleanup(
-                image,
-                lang=self.config.lang,
-                reflow=self.config.reflow,
-                cleanup_model=cleanup_model
-            )
-            return OCRResult(
-                page_num=page_num,
-                text=raw_text,
-                cleaned_text=cleaned_text
+        text: str,
+        cleaned_text: Optional[str],
+        results: Set[int],
+        cleaned_results: Set[int]
+    ) -> None:
+        """
+        Write a page (and its cleaned text) to the pages folder.
+
+        Only the page number is kept, plus running character and word
+        counts for the statistics; the merged documents are later
+        streamed from the page files.
+        """
+        self.text_processor.save_page(pages_folder, page_num, text)
+        results.add(page_num)
+        self._characters += len(text)
+        self._words += len(text.split())
+
+        if cleaned_text is not None:
+            self.text_processor.save_page(
+                pages_folder, page_num, cleaned_text, "_clean"
             )
-        except Exception as e:
-            return OCRResult(page_num=page_num, error=str(e))
+            cleaned_results.add(page_num)
 
     def _process_with_tesseract(
         self,
@@ -295,18 +697,34 @@ class Pipeline:
         if not isinstance(tesseract_engine, TesseractEngine):
             raise RuntimeError("Expected Tesseract engine")
 
-        if workers > 1 and len(pages) > 1:
-            results = self._process_tesseract_parallel(
+        # Skip pages already in the cache
+        pages = self._take_cached(pages, results, cleaned_results)
+
+        if not pages:
+            new_results = {}
+        elif workers > 1 and len(pages) > 1:
+            new_results = self._process_tesseract_parallel(
                 pdf_path, pages, tesseract_engine, workers
             )
         else:
-            results = self._process_tesseract_sequential(
+            new_results = self._process_tesseract_sequential(
                 pdf_path, pages, tesseract_engine
             )
+        results.update(new_results)
+        for page_num, text in new_results.items():
+            self._cache_put(page_num, text)
 
         # Run cleanup pass if enabled (uses Claude)
         if self.config.cleanup:
-            cleaned_results = self._run_tesseract_cleanup(results)
+            uncleaned = {
+                page_num: text for page_num, text in results.items()
+                if page_num not in cleaned_results
+            }
+            if uncleaned:
+                new_cleaned = self._run_tesseract_cleanup(uncleaned)
+                cleaned_results.update(new_cleaned)
+                for page_num, cleaned_text in new_cleaned.items():
+                    self._cache_put(page_num, results[page_num], cleaned_text)
 
         return results, cleaned_results
 
@@ -317,41 +735,75 @@ class Pipeline:
         engine: TesseractEngine,
         workers: int
     ) -> Dict[int, str]:
-        """Process pages in parallel with Tesseract."""
+        """
+        Process pages in parallel with Tesseract.
+
+        Pages are rendered here, TESSERACT_RENDER_PAGES at a time, into a
+        temporary folder; workers get the image path rather than the PDF,
+        so Poppler parses the document once per chunk instead of once per
+        page. The next chunk renders while the workers OCR the previous
+        one, and at most two chunks are on disk at a time.
+        """
         print(f"\n🚀 Using parallel processing with {workers} workers...")
 
         results = {}
+        pending: Deque[List[Tuple[int, Future]]] = deque()
 
-        # Prepare arguments for multiprocessing
-        # Note: We pass primitive types that can be pickled
-        page_args = [
-            (
-                str(pdf_path), page_num, self.config.dpi, self.config.lang,
-                self.config.preprocess.value, engine.psm, engine.oem,
-                engine.auto_rotate, engine.rotate_confidence
-            )
-            for page_num in pages
-        ]
-
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            futures = {
-                executor.submit(_process_tesseract_page, args): args[1]
-                for args in page_args
-            }
-
-            for future in as_completed(futures):
-                page_num = futures[future]
+        def collect() -> None:
+            for page_num, future in pending.popleft():
                 try:
                     result = future.result()
-                    if result.success:
-                        results[result.page_num] = result.text
-                        rot_info = (f" (rotated {result.rotation}°)"
-                                   if result.rotation else "")
-                        print(f"   📝 Page {result.page_num}...{rot_info} ✓")
-                    else:
-                        print(f"   📝 Page {page_num}... ⚠️ (empty)")
                 except Exception as e:
                     print(f"   📝 Page {page_num}... ❌ ({e})")
+                    continue
+                if result.success:
+                    results[result.page_num] = result.text
+                    rot_info = (f" (rotated {result.rotation}°)"
+                               if result.rotation else "")
+                    print(f"   📝 Page {result.page_num}...{rot_info} ✓")
+                else:
+                    print(f"   📝 Page {result.page_num}... ⚠️ (empty)")
+
+        # Each worker builds its engine once, in the initializer
+        with tempfile.TemporaryDirectory(prefix="pdf-scribe-") as tmp, \
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_tesseract_worker,
+                    initargs=(
+                        engine.psm, engine.oem,
+                        engine.auto_rotate, engine.rotate_confidence,
+                        self.config.binarize_threshold,
+                        self.config.max_dim,
+                        self.config.preprocess.value
+                    )
+                ) as executor:
+            for start in range(0, len(pages), TESSERACT_RENDER_PAGES):
+                chunk = pages[start:start + TESSERACT_RENDER_PAGES]
+                try:
+                    rendered = PDFUtils.render_pages(
+                        pdf_path, chunk, self.config.dpi, Path(tmp),
+                        grayscale=self.config.render_grayscale,
+                        thread_count=RENDER_THREADS,
+                        max_long_edge=self.config.max_dim
+                    )
+                except PDFError as e:
+                    for page_num in chunk:
+                        print(f"   📝 Page {page_num}... ❌ ({e})")
+                    continue
+
+                # Note: We pass primitive types that can be pickled
+                pending.append([
+                    (page_num, executor.submit(
+                        _process_tesseract_page,
+                        (image_path, page_num, self.config.lang)
+                    ))
+                    for page_num, image_path in rendered
+                ])
+                if len(pending) > 1:
+                    collect()
+
+            while pending:
+                collect()
 
         return results
 
@@ -361,31 +813,42 @@ class Pipeline:
         pages: List[int],
         engine: TesseractEngine
     ) -> Dict[int, str]:
-        """Process pages sequentially with Tesseract."""
+        """
+        Process pages sequentially with Tesseract.
+
+        A producer/consumer pipeline: up to TESSERACT_PREFETCH upcoming
+        pages are converted, rotation-checked (an OSD pass) and
+        preprocessed on the shared pool while this thread OCRs the current
+        one, so rendering and the Tesseract calls overlap instead of
+        running back to back. The bounded lookahead keeps memory at a few
+        page images.
+        """
         print(f"\n🔄 Processing {len(pages)} pages sequentially...")
 
         results = {}
 
-        for page_num in pages:
+        upcoming = iter(pages)
+        ahead: Deque[Tuple[int, Future]] = deque()
+
+        def fill() -> None:
+            while len(ahead) < TESSERACT_PREFETCH:
+                page_num = next(upcoming, None)
+                if page_num is None:
+                    return
+                ahead.append((page_num, self.pool.submit(
+                    self._prepare_tesseract_page, pdf_path, page_num, engine
+                )))
+
+        fill()
+        while ahead:
+            page_num, current = ahead.popleft()
+            fill()
             print(f"   📝 Page {page_num}...", end=" ", flush=True)
 
             try:
-                # Convert single page
-                image = PDFUtils.convert_single_page(
-                    pdf_path, page_num, self.config.dpi
-                )
-
-                # Auto-rotate if enabled
-                rotation = 0
-                if engine.auto_rotate:
-                    image, rotation = engine.detect_rotation(image)
-                    if rotation:
-                        print(f"(rotated {rotation}°) ", end="", flush=True)
-
-                # Preprocess
-                image = self.image_processor.process(
-                    image, self.config.preprocess
-                )
+                image, rotation = current.result()
+                if rotation:
+                    print(f"(rotated {rotation}°) ", end="", flush=True)
 
                 # OCR
                 text = engine.process_image(image, lang=self.config.lang)
@@ -397,55 +860,89 @@ class Pipeline:
 
         return results
 
+    def _prepare_tesseract_page(
+        self,
+        pdf_path: Path,
+        page_num: int,
+        engine: TesseractEngine
+    ) -> Tuple[Image.Image, int]:
+        """Convert, auto-rotate (if enabled) and preprocess one page."""
+        image = PDFUtils.convert_single_page(
+            pdf_path, page_num, self.config.dpi,
+            grayscale=self.config.render_grayscale,
+            max_long_edge=self.config.max_dim
+        )
+
+        rotation = 0
+        if engine.auto_rotate:
+            image, rotation = engine.detect_rotation(image)
+
+        image = self.image_processor.process(image, self.config.preprocess)
+        return image, rotation
+
     def _run_tesseract_cleanup(
         self,
         results: Dict[int, str]
     ) -> Dict[int, str]:
         """Run AI cleanup on Tesseract results."""
         try:
-            claude_engine = ClaudeEngine(model=self.config.claude_model)
-            claude_engine.validate()
+            claude_engine = self.cleanup_engine
         except Exception as e:
             print(f"\n⚠️  Cleanup skipped: {e}")
             return {}
 
-        print(f"\n🧹 Running AI cleanup ({self.config.claude_model})"
-              f"{self.config.mode_suffix}...")
+        print(f"\n🧹 Running AI cleanup ({self.config.cleanup_model}, "
+              f"escalating to {self.config.claude_model})...")
 
         cleaned_results = {}
         max_workers = self.config.effective_workers
-
-        print(f"   🔄 Cleaning {len(results)} pages with {max_workers} threads...")
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {}
-            for page_num, text in results.items():
-                future = executor.submit(
-                    claude_engine.cleanup_text,
-                    text,
-                    self.config.lang
-                )
-                futures[future] = page_num
-
-            for future in as_completed(futures):
-                page_num = futures[future]
-                try:
-                    cleaned_text = future.result()
-                    cleaned_results[page_num] = cleaned_text
+        escalated_before = claude_engine.cleanups_escalated
+
+        # Several consecutive pages per request; buckets run in parallel
+        buckets = claude_engine.split_cleanup_batches(results)
+        print(f"   🔄 Cleaning {len(results)} pages in {len(buckets)} requests "
+              f"with {max_workers} threads...")
+
+        futures = {
+            self.pool.submit(
+                claude_engine.cleanup_batch,
+                bucket,
+                self.config.lang,
+                model=self.config.cleanup_model
+            ): bucket
+            for bucket in buckets
+        }
+
+        for future in as_completed(futures):
+            bucket = futures[future]
+            try:
+                cleaned_results.update(future.result())
+                for page_num in sorted(bucket):
                     print(f"   🧹 Page {page_num}... ✓")
-                except Exception as e:
+            except Exception as e:
+                for page_num in sorted(bucket):
                     print(f"   🧹 Page {page_num}... ❌ ({e})")
 
+        escalated = claude_engine.cleanups_escalated - escalated_before
+        if escalated:
+            print(f"   ⬆️  {escalated} cleanup(s) redone "
+                  f"on {self.config.claude_model}")
+
         return cleaned_results
 
     def _save_documents(
         self,
         pdf_path: Path,
         output_path: Path,
-        results: Dict[int, str],
-        cleaned_results: Dict[int, str]
+        results: Union[Dict[int, str], Set[int]],
+        cleaned_results: Union[Dict[int, str], Set[int]]
     ) -> Path:
-        """Save the final documents."""
+        """
+        Save the final documents.
+
+        Streamed (Claude) runs copy the page files into the documents one
+        at a time instead of building them in memory.
+        """
         # Build header
         title = self.config.title or pdf_path.stem.replace("_", " ").replace("-", " ").title()
         header = self.text_processor.build_header(
@@ -460,22 +957,35 @@ class Pipeline:
 
         # Save main document
         print(f"\n   📦 Merging {len(results)} pages into final document...")
-        main_doc = self.text_processor.merge_pages(header, results)
-        self.text_processor.save_document(output_path, main_doc)
+        self._write_document(output_path, header, results)
 
         # Save cleaned document if available
         if cleaned_results:
             print(f"   📦 Creating cleaned merged document...")
-            clean_doc = self.text_processor.merge_pages(header, cleaned_results)
             clean_path = output_path.parent / f"{output_path.stem}_clean.md"
-            self.text_processor.save_document(clean_path, clean_doc)
+            self._write_document(clean_path, header, cleaned_results, "_clean")
             print(f"   ✓ Cleaned document: {clean_path}")
 
         return output_path
 
+    def _write_document(
+        self,
+        path: Path,
+        header: str,
+        pages: Union[Dict[int, str], Set[int]],
+        suffix: str = ""
+    ) -> None:
+        """Write a merged document from page texts or streamed page files."""
+        if self._pages_folder is None:
+            self.text_processor.write_pages(path, header, pages)
+        else:
+            self.text_processor.merge_page_files(
+                path, header, self._pages_folder, sorted(pages), suffix
+            )
+
     def _print_header(self, pdf_path: Path) -> None:
         """Print the startup header."""
-        engine_display = "Claude Vision AI" if self.config.engine == Engine.CLAUDE else "Tesseract"
+        engine_display = "Claude Vision AI" if self.config.engine is Engine.CLAUDE else "Tesseract"
         print(f"🤖 Using engine: {engine_display}")
         print(f"🌐 Language: {self.config.lang}")
         print(f"📄 Analyzing PDF: {pdf_path.name}")
@@ -488,10 +998,12 @@ class Pipeline:
         else:
             print(f"📚 Total pages: {total_pages}")
 
-        print(f"⚙️  Config: DPI={self.config.dpi}, Language={self.config.lang}, "
+        max_size = f"{self.config.max_dim}px" if self.config.max_dim else "none"
+        print(f"⚙️  Config: DPI={self.config.dpi}, Max size={max_size}, "
+              f"Language={self.config.lang}, "
               f"Workers={self.config.workers}, Engine={self.config.engine.value}")
 
-        if self.config.engine == Engine.TESSERACT:
+        if self.config.engine is Engine.TESSERACT:
             print(f"🔧 Preprocessing: {self.config.preprocess.value} | "
                   f"PSM: {self.config.psm} | OEM: {self.config.oem}")
             if self.config.auto_rotate:
@@ -503,16 +1015,14 @@ class Pipeline:
 
     def _print_statistics(
         self,
-        results: Dict[int, str],
+        pages_count: int,
+        characters: int,
+        words: int,
         output_path: Path,
         elapsed_time: float
     ) -> None:
         """Print final statistics including timing."""
-        full_text = "\n".join(results.values())
-        stats = self.text_processor.get_statistics(full_text)
-
         # Calculate timing stats
-        pages_count = len(results)
         per_page_time = elapsed_time / pages_count if pages_count > 0 else 0
         pages_per_minute = 60 / per_page_time if per_page_time > 0 else 0
 
@@ -530,56 +1040,107 @@ class Pipeline:
         print(f"   Pages processed: {pages_count}")
         print(f"   Total time: {time_str}")
         print(f"   Rate: {per_page_time:.2f}s/page ({pages_per_minute:.1f} pages/min)")
-        print(f"   Total characters: {stats['characters']:,}")
-        print(f"   Approximate words: {stats['words']:,}")
+        print(f"   Total characters: {characters:,}")
+        print(f"   Approximate words: {words:,}")
+        if isinstance(self._engine, ClaudeEngine) and self._engine.pages_upgraded:
+            print(f"   Hi-res retries: {self._engine.pages_upgraded}/"
+                  f"{self._engine.pages_processed} pages "
+                  f"({self._engine.upgrade_rate:.0%})")
+        if isinstance(self._engine, ClaudeEngine) and self._engine.pages_blank:
+            print(f"   Blank pages skipped: {self._engine.pages_blank}")
+        if isinstance(self._engine, ClaudeEngine) and self._engine.cleanups_escalated:
+            print(f"   Cleanup escalations: {self._engine.cleanups_escalated}/"
+                  f"{self._engine.cleanups_run} pages "
+                  f"({self._engine.escalation_rate:.0%})")
         print(f"   Output file: {output_path}")
         print(f"   Size: {output_path.stat().st_size / 1024:.1f} KB")
         print("=" * 50)
 
 
+# Pages rendered to disk per Poppler call for the Tesseract workers
+TESSERACT_RENDER_PAGES = 20
+
+# Poppler processes per multi-page render
+RENDER_THREADS = 2
+
+# Pages prepared ahead of the OCR in the sequential Tesseract path
+TESSERACT_PREFETCH = 2
+
+# Pages converted to images at a time for Claude
+CLAUDE_CHUNK_PAGES = 32
+
+# Per-process engine, image processor and preprocessing mode, built once
+# by _init_tesseract_worker
+_worker_engine: Optional[TesseractEngine] = None
+_worker_processor: Optional[ImageProcessor] = None
+_worker_preprocess: PreprocessMode = PreprocessMode.NONE
+
+
+def _init_tesseract_worker(
+    psm: int,
+    oem: int,
+    auto_rotate: bool,
+    rotate_confidence: float,
+    binarize_threshold: int,
+    max_dim: int,
+    preprocess: str
+) -> None:
+    """
+    Process pool initializer: build this worker's Tesseract engine and
+    image processor.
+
+    Runs once per worker process so pages don't each pay for engine
+    construction and the binary/language probes. Settings shared by every
+    page travel here rather than in each task.
+    """
+    global _worker_engine, _worker_processor, _worker_preprocess
+    _worker_engine = TesseractEngine(
+        psm=psm, oem=oem,
+        auto_rotate=auto_rotate,
+        rotate_confidence=rotate_confidence
+    )
+    _worker_engine.is_available()
+    _worker_processor = ImageProcessor(binarize_threshold, max_dim)
+    _worker_preprocess = PreprocessMode(preprocess)
+
+
 # Module-level function for multiprocessing (must be picklable)
 def _process_tesseract_page(args: tuple) -> OCRResult:
     """
     Process a single page with Tesseract.
 
     This function runs in a separate process and must be at module level
-    to be picklable by multiprocessing.
+    to be picklable by multiprocessing. The engine comes from the
+    worker's initializer; the page image is a file rendered by the parent.
     """
-    (pdf_path, page_num, dpi, lang, preprocess,
-     psm, oem, auto_rotate, rotate_confidence) = args
+    image_path, page_num, lang = args
 
     try:
-        from pdf2image import convert_from_path
-        from transcriptor.engines.tesseract import TesseractEngine
-        from transcriptor.processors.image import ImageProcessor
-        from transcriptor.config import PreprocessMode
-
-        # Convert page
-        images = convert_from_path(
-            pdf_path, dpi=dpi,
-            first_page=page_num, last_page=page_num
-        )
-
-        if not images:
-            return OCRResult(page_num=page_num, error="No image returned")
-
-        image = images[0]
+        # Page rendered by the parent; done with the file once loaded
+        image = Image.open(image_path)
+        image.load()
+        os.remove(image_path)
         rotation = 0
 
-        # Create engine for this process
-        engine = TesseractEngine(
-            psm=psm, oem=oem,
-            auto_rotate=auto_rotate,
-            rotate_confidence=rotate_confidence
-        )
+        # Engine and processor built by the pool initializer
+        engine = _worker_engine
+        if engine is None:
+            engine = TesseractEngine()
+        processor = _worker_processor
+        if processor is None:
+            processor = ImageProcessor()
 
         # Auto-rotate
-        if auto_rotate:
+        if engine.auto_rotate:
             image, rotation = engine.detect_rotation(image)
 
         # Preprocess
-        processor = ImageProcessor()
-        image = processor.process(image, PreprocessMode(preprocess))
+        try:
+            image = processor.process(image, _worker_preprocess)
+        except Exception as e:
+            return OCRResult.failure(
+                page_num, str(e), OCRResult.ERR_PREPROCESS
+            )
 
         # OCR
         text = engine.process_image(image, lang=lang)
@@ -587,4 +1148,4 @@ def _process_tesseract_page(args: tuple) -> OCRResult:
         return OCRResult(page_num=page_num, text=text, rotation=rotation)
 
     except Exception as e:
-        return OCRResult(page_num=page_num, error=str(e))
+        return OCRResult.failure(page_num, str(e))
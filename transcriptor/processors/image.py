@@ -5,10 +5,48 @@ Provides various image enhancement techniques to improve OCR accuracy.
 Each preprocessing mode targets specific document quality issues.
 """
 
-from PIL import Image, ImageEnhance, ImageFilter
+from functools import cache
+from typing import List, Tuple
+
+from PIL import Image, ImageChops, ImageEnhance, ImageFilter, ImageStat
 
 from transcriptor.config import PreprocessMode
 
+# Optional import - the PIL filters are used without it
+try:
+    import cv2
+    import numpy as np
+    CV2_AVAILABLE = True
+except ImportError:
+    cv2 = None
+    np = None
+    CV2_AVAILABLE = False
+
+# Optional JIT for the per-pixel fallback when OpenCV is absent
+try:
+    import numba
+    import numpy as np
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+# PIL's ImageFilter.SHARPEN kernel, for cv2.filter2D
+if CV2_AVAILABLE:
+    _SHARPEN_KERNEL = np.array(
+        ImageFilter.SHARPEN.filterargs[3], dtype=np.float32
+    ).reshape(3, 3) / ImageFilter.SHARPEN.filterargs[1]
+
+# ImageProcessor method for each step of a mode plan (see _mode_plan)
+_PIL_STEPS = {
+    "contrast": "enhance_contrast",
+    "sharpen": "sharpen",
+    "denoise": "denoise",
+    "binarize": "binarize",
+    "adaptive": "binarize_adaptive",
+    "auto": "_binarize_auto",
+}
+
 
 class ImageProcessor:
     """
@@ -18,15 +56,40 @@ class ImageProcessor:
     can be applied individually or in combination.
     """
 
-    def __init__(self, binarize_threshold: int = 140):
+    # Adaptive threshold: neighbourhood size (odd) and offset below the
+    # local mean, as in cv2.adaptiveThreshold
+    ADAPTIVE_BLOCK_SIZE = 31
+    ADAPTIVE_C = 10
+    # Background stddev above which "clean" switches to the adaptive
+    # threshold (lighting varies across the page)
+    UNEVEN_MIN_STDDEV = 20.0
+    # Default longest edge in pixels; OCR accuracy plateaus around 300 DPI
+    MAX_DIM = 3500
+
+    def __init__(self, binarize_threshold: int = 140, max_dim: int = MAX_DIM):
         """
         Initialize the image processor.
 
         Args:
             binarize_threshold: Threshold for binarization (0-255)
                                Lower = more black, higher = more white
+            max_dim: Longest image edge in pixels; larger pages are
+                     downscaled before preprocessing (0 = no limit)
         """
         self.binarize_threshold = binarize_threshold
+        self.max_dim = max_dim
+
+    @property
+    def binarize_threshold(self) -> int:
+        """Threshold for binarize (0-255)."""
+        return self._binarize_threshold
+
+    @binarize_threshold.setter
+    def binarize_threshold(self, value: int) -> None:
+        self._binarize_threshold = value
+        # Lookup table for binarize, so PIL maps pixels in C rather than
+        # calling back into Python per value; rebuilt with the threshold
+        self._binarize_lut = [0] * (value + 1) + [255] * (255 - value)
 
     def process(
         self,
@@ -43,36 +106,140 @@ class ImageProcessor:
         Returns:
             Processed PIL Image
         """
-        if mode == PreprocessMode.NONE:
+        image = self.downscale(image)
+
+        if mode is PreprocessMode.NONE:
             return image
 
         # Handle color highlight removal BEFORE grayscale conversion
         image = self._handle_color_channels(image, mode)
 
-        if mode in (PreprocessMode.GRAYSCALE, PreprocessMode.REMOVE_RED,
-                    PreprocessMode.REMOVE_BLUE):
+        plan = self._mode_plan(mode)
+        if not plan:
             return image
 
-        # Apply enhancements
+        # Single pass over one array with OpenCV, one PIL round trip
+        if CV2_AVAILABLE:
+            arr = self._process_fast(np.asarray(image), plan)
+            return Image.fromarray(arr, "L")
+
+        for step in plan:
+            image = getattr(self, _PIL_STEPS[step])(image)
+        return image
+
+    @classmethod
+    @cache
+    def _mode_plan(cls, mode: PreprocessMode) -> Tuple[str, ...]:
+        """
+        Enhancement steps for a mode, in order (built once per mode).
+
+        Steps are "contrast", "sharpen", "denoise" and one of "binarize",
+        "adaptive" or "auto" (adaptive on unevenly lit pages, else the
+        global threshold). "soft" skips denoise and binarize.
+        """
+        steps = []
         if mode in (PreprocessMode.CONTRAST, PreprocessMode.ALL,
                     PreprocessMode.CLEAN, PreprocessMode.SOFT):
-            image = self.enhance_contrast(image)
-
+            steps.append("contrast")
         if mode in (PreprocessMode.SHARPEN, PreprocessMode.ALL,
                     PreprocessMode.CLEAN, PreprocessMode.SOFT):
-            image = self.sharpen(image)
-
+            steps.append("sharpen")
         if mode in (PreprocessMode.DENOISE, PreprocessMode.ALL,
                     PreprocessMode.CLEAN):
-            # Skip denoise for "soft" mode
-            image = self.denoise(image)
+            steps.append("denoise")
 
-        if mode in (PreprocessMode.BINARIZE, PreprocessMode.ALL,
-                    PreprocessMode.CLEAN):
-            # Skip binarize for "soft" mode
-            image = self.binarize(image)
+        if mode is PreprocessMode.ADAPTIVE:
+            steps.append("adaptive")
+        elif mode is PreprocessMode.CLEAN:
+            steps.append("auto")
+        elif mode in (PreprocessMode.BINARIZE, PreprocessMode.ALL):
+            steps.append("binarize")
+        return tuple(steps)
 
-        return image
+    def downscale(self, image: Image.Image) -> Image.Image:
+        """
+        Shrink an image so its longest edge is at most max_dim.
+
+        Extra pixels beyond ~300 DPI don't improve OCR but every filter
+        and the OCR itself scale with the pixel count.
+
+        Args:
+            image: PIL Image
+
+        Returns:
+            The image, downscaled if it was larger than max_dim
+        """
+        longest = max(image.size)
+        if not self.max_dim or longest <= self.max_dim:
+            return image
+        scale = self.max_dim / longest
+        size = (round(image.width * scale), round(image.height * scale))
+        # reducing_gap: box-reduce first, then Lanczos on the small image
+        return image.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+    def _binarize_auto(self, image: Image.Image) -> Image.Image:
+        """Binarize with the local threshold if the page is unevenly lit."""
+        if self.is_unevenly_lit(image):
+            return self.binarize_adaptive(image)
+        return self.binarize(image)
+
+    def _process_fast(self, arr: "np.ndarray", plan: Tuple[str, ...]) -> "np.ndarray":
+        """
+        OpenCV equivalent of the PIL enhancement chain.
+
+        Works on one uint8 grayscale array: the point operations
+        (contrast, threshold) are lookup tables and the filters are
+        OpenCV's SIMD kernels, with the same factor, kernel and threshold
+        as the PIL methods. Each step writes into a reused output buffer
+        (at most two for the chain, ping-ponged), so a page allocates one
+        or two arrays instead of one per step.
+
+        Args:
+            arr: Grayscale image as a 2-D uint8 array
+            plan: Steps to apply, from _mode_plan
+
+        Returns:
+            Processed uint8 array
+        """
+        # Output buffers free for the next step; the input array is not
+        # ours to overwrite (and may be read-only)
+        free: List["np.ndarray"] = []
+        owned = False
+
+        def step(op, *args) -> None:
+            nonlocal arr, owned
+            dst = free.pop() if free else np.empty_like(arr)
+            op(arr, *args, dst=dst)
+            if owned:
+                free.append(arr)
+            arr, owned = dst, True
+
+        if "contrast" in plan:
+            # ImageEnhance.Contrast: blend away from the mean, factor 2
+            mean = int(cv2.mean(arr)[0] + 0.5)
+            lut = np.clip(
+                mean + 2 * (np.arange(256) - mean), 0, 255
+            ).astype(np.uint8)
+            step(cv2.LUT, lut)
+
+        if "sharpen" in plan:
+            step(cv2.filter2D, -1, _SHARPEN_KERNEL)
+
+        if "denoise" in plan:
+            step(cv2.medianBlur, 3)
+
+        if "adaptive" in plan or (
+            "auto" in plan and self.is_unevenly_lit(Image.fromarray(arr, "L"))
+        ):
+            step(
+                cv2.adaptiveThreshold,
+                255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+                self.ADAPTIVE_BLOCK_SIZE, self.ADAPTIVE_C
+            )
+        elif "binarize" in plan or "auto" in plan:
+            step(cv2.threshold, self.binarize_threshold, 255, cv2.THRESH_BINARY)
+
+        return arr
 
     def _handle_color_channels(
         self,
@@ -92,14 +259,15 @@ class ImageProcessor:
         Returns:
             Grayscale image (L mode)
         """
+        # Already a single channel: nothing to extract or convert
+        if image.mode == "L":
+            return image
         if mode in (PreprocessMode.REMOVE_RED, PreprocessMode.CLEAN,
                     PreprocessMode.SOFT) and image.mode == "RGB":
             # Use red channel - red highlights appear white
-            r, g, b = image.split()
-            return r
-        elif mode == PreprocessMode.REMOVE_BLUE and image.mode == "RGB":
-            r, g, b = image.split()
-            return b
+            return self.remove_red_highlights(image)
+        elif mode is PreprocessMode.REMOVE_BLUE and image.mode == "RGB":
+            return self.remove_blue_highlights(image)
         elif image.mode != "L":
             return image.convert("L")
         return image
@@ -146,6 +314,11 @@ class ImageProcessor:
         Returns:
             Denoised image
         """
+        if image.mode == "L" and size == 3:
+            if CV2_AVAILABLE:
+                return Image.fromarray(cv2.medianBlur(np.asarray(image), 3), "L")
+            if NUMBA_AVAILABLE:
+                return Image.fromarray(_median3_nb(np.asarray(image)), "L")
         return image.filter(ImageFilter.MedianFilter(size=size))
 
     def binarize(self, image: Image.Image) -> Image.Image:
@@ -158,9 +331,51 @@ class ImageProcessor:
         Returns:
             Binarized image
         """
-        threshold = self.binarize_threshold
-        image = image.point(lambda x: 255 if x > threshold else 0, mode="1")
-        return image.convert("L")  # Back to grayscale for compatibility
+        # Stays grayscale (0/255) for compatibility
+        return self.to_grayscale(image).point(self._binarize_lut)
+
+    def binarize_adaptive(self, image: Image.Image) -> Image.Image:
+        """
+        Convert to black and white against the local background.
+
+        Each pixel is compared with the Gaussian-weighted mean of its
+        neighbourhood minus ADAPTIVE_C, so shadows and uneven lighting
+        don't turn whole regions black or white.
+
+        Args:
+            image: PIL Image (should be grayscale)
+
+        Returns:
+            Binarized image (L mode, 0/255)
+        """
+        image = self.to_grayscale(image)
+        if CV2_AVAILABLE:
+            arr = cv2.adaptiveThreshold(
+                np.asarray(image), 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                cv2.THRESH_BINARY, self.ADAPTIVE_BLOCK_SIZE, self.ADAPTIVE_C
+            )
+            return Image.fromarray(arr, "L")
+
+        # White where pixel > local mean - C, i.e. local mean - pixel < C
+        local_mean = image.filter(
+            ImageFilter.GaussianBlur(self.ADAPTIVE_BLOCK_SIZE / 6)
+        )
+        below = ImageChops.subtract(local_mean, image)
+        return below.point(
+            [255 if x < self.ADAPTIVE_C else 0 for x in range(256)]
+        )
+
+    def is_unevenly_lit(self, image: Image.Image) -> bool:
+        """
+        Check whether the page background varies a lot in brightness.
+
+        Looks at a heavily downscaled copy, which keeps the lighting and
+        averages the text away.
+        """
+        small = self.to_grayscale(image).reduce(
+            max(1, min(image.size) // 32)
+        )
+        return ImageStat.Stat(small).stddev[0] > self.UNEVEN_MIN_STDDEV
 
     def remove_red_highlights(self, image: Image.Image) -> Image.Image:
         """
@@ -177,8 +392,8 @@ class ImageProcessor:
         """
         if image.mode != "RGB":
             return image.convert("L")
-        r, g, b = image.split()
-        return r
+        # Copies one band only; split() would materialize all three
+        return image.getchannel("R")
 
     def remove_blue_highlights(self, image: Image.Image) -> Image.Image:
         """
@@ -192,5 +407,54 @@ class ImageProcessor:
         """
         if image.mode != "RGB":
             return image.convert("L")
-        r, g, b = image.split()
-        return b
+        return image.getchannel("B")
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, nogil=True, inline="always")
+    def _sort2(a, b):
+        """Compare-exchange for the median sorting network."""
+        return min(a, b), max(a, b)
+
+    @numba.njit(cache=True, parallel=True, nogil=True)
+    def _median3_nb(arr):
+        """
+        3x3 median filter on a uint8 array (JIT-compiled).
+
+        Uses the 19-exchange median-of-9 network per pixel, rows in
+        parallel. Borders are filtered against replicated edge pixels,
+        like PIL's MedianFilter. nogil lets pages run concurrently in a
+        thread pool.
+        """
+        h, w = arr.shape
+        out = np.empty_like(arr)
+        for y in numba.prange(h):
+            y0 = max(y - 1, 0)
+            y2 = min(y + 1, h - 1)
+            for x in range(w):
+                x0 = max(x - 1, 0)
+                x2 = min(x + 1, w - 1)
+                p0, p1, p2 = arr[y0, x0], arr[y0, x], arr[y0, x2]
+                p3, p4, p5 = arr[y, x0], arr[y, x], arr[y, x2]
+                p6, p7, p8 = arr[y2, x0], arr[y2, x], arr[y2, x2]
+                p1, p2 = _sort2(p1, p2)
+                p4, p5 = _sort2(p4, p5)
+                p7, p8 = _sort2(p7, p8)
+                p0, p1 = _sort2(p0, p1)
+                p3, p4 = _sort2(p3, p4)
+                p6, p7 = _sort2(p6, p7)
+                p1, p2 = _sort2(p1, p2)
+                p4, p5 = _sort2(p4, p5)
+                p7, p8 = _sort2(p7, p8)
+                p0, p3 = _sort2(p0, p3)
+                p5, p8 = _sort2(p5, p8)
+                p4, p7 = _sort2(p4, p7)
+                p3, p6 = _sort2(p3, p6)
+                p1, p4 = _sort2(p1, p4)
+                p2, p5 = _sort2(p2, p5)
+                p4, p7 = _sort2(p4, p7)
+                p4, p2 = _sort2(p4, p2)
+                p6, p4 = _sort2(p6, p4)
+                p4, p2 = _sort2(p4, p2)
+                out[y, x] = p4
+        return out
@@ -4,8 +4,31 @@ Text processing module.
 Provides utilities for text formatting and document assembly.
 """
 
+import io
+import os
+import shutil
 from pathlib import Path
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, Iterable, Optional, TextIO
+
+# Optional import - word counts fall back to str.split without it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Texts at least this long are word-counted with NumPy
+_NUMPY_WORDS_MIN = 1 << 16
+
+# Write buffer for documents merged from page files
+_MERGE_BUFFER = 1 << 20
+
+# Separator written before each page file by merge_page_files
+_PAGE_RULE = b"\n---\n\n"
+
+# Flags for _write_bytes: create or truncate, write only
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
 
 
 class TextProcessor:
@@ -81,7 +104,8 @@ class TextProcessor:
     @staticmethod
     def merge_pages(
         header: str,
-        pages: Dict[int, str]
+        pages: Dict[int, str],
+        presorted: bool = False
     ) -> str:
         """
         Merge all pages into a single document.
@@ -89,14 +113,55 @@ class TextProcessor:
         Args:
             header: Document header
             pages: Dict mapping page numbers to text
+            presorted: pages is already in page order; skip sorting
 
         Returns:
             Complete merged document
         """
-        parts = [header]
-        for page_num in sorted(pages.keys()):
-            parts.append(TextProcessor.format_page(page_num, pages[page_num]))
-        return "".join(parts)
+        buffer = io.StringIO()
+        TextProcessor.merge_pages_to(buffer, header, pages, presorted)
+        return buffer.getvalue()
+
+    @staticmethod
+    def merge_pages_to(
+        stream: TextIO,
+        header: str,
+        pages: Dict[int, str],
+        presorted: bool = False
+    ) -> int:
+        """
+        Write a merged document into an open text stream.
+
+        Writes exactly what merge_pages returns, piece by piece, so no
+        per-page strings are built and nothing is joined.
+
+        Args:
+            stream: Writable text stream
+            header: Document header
+            pages: Dict mapping page numbers to text
+            presorted: pages is already in page order; skip sorting
+
+        Returns:
+            Number of characters written
+        """
+        write = stream.write
+        written = write(header)
+        items = (
+            pages.items() if presorted
+            else ((n, pages[n]) for n in sorted(pages))
+        )
+        for page_num, text in items:
+            written += write("\n---\n\n## Page ")
+            written += write(str(page_num))
+            written += write("\n\n")
+            written += write(text)
+            written += write("\n")
+        return written
+
+    @staticmethod
+    def page_path(folder: Path, page_num: int, suffix: str = "") -> Path:
+        """Get the file a page is saved to by save_page."""
+        return folder / f"page_{page_num:03d}{suffix}.md"
 
     @staticmethod
     def save_page(
@@ -108,8 +173,13 @@ class TextProcessor:
         """
         Save a single page to a file.
 
+        Called once per page on the result-handling path, so it does no
+        existence checks: the folder must already exist (create it once,
+        before the run). The page is encoded once and written straight
+        to the descriptor, without a buffered file object.
+
         Args:
-            folder: Output folder
+            folder: Output folder (must exist)
             page_num: Page number
             text: Page text
             suffix: Optional suffix (e.g., "_clean")
@@ -117,12 +187,9 @@ class TextProcessor:
         Returns:
             Path to the saved file
         """
-        filename = f"page_{page_num:03d}{suffix}.md"
-        filepath = folder / filename
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(f"## Page {page_num}\n\n{text}\n")
-
+        filepath = TextProcessor.page_path(folder, page_num, suffix)
+        page = f"## Page {page_num}\n\n{text}\n"
+        _write_bytes(filepath, page.encode("utf-8"))
         return filepath
 
     @staticmethod
@@ -133,6 +200,9 @@ class TextProcessor:
         """
         Save a complete document.
 
+        The content is encoded once and written unbuffered, in one
+        write() for all but enormous documents.
+
         Args:
             path: Output path
             content: Document content
@@ -140,8 +210,71 @@ class TextProcessor:
         Returns:
             Path to the saved file
         """
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        _write_bytes(path, content.encode("utf-8"))
+        return path
+
+    @staticmethod
+    def write_pages(
+        path: Path,
+        header: str,
+        pages: Dict[int, str],
+        presorted: bool = False
+    ) -> Path:
+        """
+        Write a merged document page by page.
+
+        Produces the same file as save_document(path, merge_pages(...))
+        without first joining the whole document into one string.
+
+        Args:
+            path: Output path
+            header: Document header
+            pages: Dict mapping page numbers to text
+            presorted: pages is already in page order; skip sorting
+
+        Returns:
+            Path to the saved file
+        """
+        with open(
+            path, "w", encoding="utf-8", newline="", buffering=_MERGE_BUFFER
+        ) as out:
+            TextProcessor.merge_pages_to(out, header, pages, presorted)
+        return path
+
+    @staticmethod
+    def merge_page_files(
+        path: Path,
+        header: str,
+        folder: Path,
+        page_nums: Iterable[int],
+        suffix: str = ""
+    ) -> Path:
+        """
+        Merge saved page files into a document, streaming them to disk.
+
+        Produces the same document as merge_pages over the page texts.
+        Page files are copied as bytes, kernel-side with os.sendfile where
+        available, so page text is never decoded or held in memory.
+
+        Args:
+            path: Output path
+            header: Document header
+            folder: Folder the pages were saved to with save_page
+            page_nums: Page numbers to include, in order
+            suffix: Page file suffix (e.g., "_clean")
+
+        Returns:
+            Path to the saved file
+        """
+        # Unbuffered: the small writes and sendfile share one file offset
+        with open(path, "wb", buffering=0) as out:
+            out.write(header.encode("utf-8"))
+            for page_num in page_nums:
+                # save_page wrote the page as format_page without the rule
+                out.write(_PAGE_RULE)
+                page_path = TextProcessor.page_path(folder, page_num, suffix)
+                with open(page_path, "rb") as f:
+                    _copy_file(f, out)
         return path
 
     @staticmethod
@@ -157,6 +290,84 @@ class TextProcessor:
         """
         return {
             "characters": len(text),
-            "words": len(text.split()),
+            "words": _count_words(text),
             "lines": text.count("\n") + 1,
         }
+
+    @staticmethod
+    def get_statistics_iter(texts: Iterable[str]) -> Dict[str, int]:
+        """
+        Calculate statistics for texts as if joined with newlines.
+
+        Gives the same result as get_statistics("\n".join(texts)) one
+        text at a time, without building the joined string.
+
+        Args:
+            texts: Page texts
+
+        Returns:
+            Dict with character count, word count, etc.
+        """
+        characters = words = newlines = count = 0
+        for text in texts:
+            characters += len(text)
+            words += _count_words(text)
+            newlines += text.count("\n")
+            count += 1
+        # The joining newlines between texts
+        joins = max(count - 1, 0)
+        return {
+            "characters": characters + joins,
+            "words": words,
+            "lines": newlines + joins + 1,
+        }
+
+
+def _count_words(text: str) -> int:
+    """
+    Count whitespace-separated words without building the word list.
+
+    Long texts are scanned as UTF-8 bytes with NumPy: a word starts at a
+    non-space byte that follows a space (or the start). Only ASCII
+    whitespace separates words there, unlike str.split, which also splits
+    on Unicode spaces such as U+00A0.
+    """
+    if not NUMPY_AVAILABLE or len(text) < _NUMPY_WORDS_MIN:
+        return len(text.split())
+    data = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    # Space, or \t \n \v \f \r
+    space = (data == 32) | ((data >= 9) & (data <= 13))
+    starts = ~space
+    starts[1:] &= space[:-1]
+    return int(np.count_nonzero(starts))
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a file straight from the descriptor, unbuffered."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _copy_file(src: BinaryIO, dst: BinaryIO) -> None:
+    """Append all of src to unbuffered dst, in the kernel if possible."""
+    if hasattr(os, "sendfile"):
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(
+                    dst.fileno(), src.fileno(), offset, size - offset
+                )
+                if not sent:
+                    break
+                offset += sent
+            return
+        except OSError:
+            # Not supported for these files; copy the rest in user space
+            src.seek(offset)
+    shutil.copyfileobj(src, dst, _MERGE_BUFFER)
@@ -0,0 +1,193 @@
+"""
+Result cache module.
+
+Provides persistent, SQLite-backed caches:
+- OCRCache: per-page results of a document, so re-running the same PDF
+  with the same settings (e.g. trial runs with --first or --pages) skips
+  pages that were already transcribed
+- ResultCache: engine results keyed by content hash, shared across
+  documents and runs
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from transcriptor.config import Config, Engine
+
+
+# Read size for hashing PDFs
+_HASH_CHUNK = 1 << 20
+
+
+def hash_file(path: Path) -> str:
+    """
+    Hash a file's contents with BLAKE2b.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_hash(config: Config) -> str:
+    """
+    Hash the settings that affect OCR output.
+
+    Cosmetic settings (title, output path, workers) are excluded so they
+    don't invalidate the cache, as is the Claude model on Tesseract runs
+    without cleanup. Python's hash() is salted per process, so a stable
+    digest is used instead.
+
+    Args:
+        config: Run configuration
+
+    Returns:
+        Hex digest
+    """
+    relevant = (
+        config.engine.value, config.dpi, config.max_dim, config.lang,
+        config.preprocess.value, config.binarize_threshold,
+        config.psm, config.oem, config.auto_rotate, config.rotate_confidence,
+        config.reflow,
+        # Tesseract runs only use the Claude model to redo short cleanups
+        config.claude_model
+        if config.engine is Engine.CLAUDE or config.cleanup else None,
+        # Entries hold cleaned text, but runs with and without cleanup
+        # share them, so the cleanup model always counts
+        config.cleanup_model,
+    )
+    return hashlib.blake2b(repr(relevant).encode(), digest_size=16).hexdigest()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open a cache database in WAL mode, creating its folder."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+
+class OCRCache:
+    """
+    Persistent page-level OCR result cache.
+
+    Entries are keyed by (pdf_hash, page_num, config_hash) and hold the raw
+    text plus the cleaned text when a cleanup pass was run. The database
+    uses WAL mode so concurrent batch workers can write safely.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+        """
+        self._lock = threading.Lock()
+        self._conn = _connect(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                " pdf_hash TEXT NOT NULL,"
+                " page_num INTEGER NOT NULL,"
+                " config_hash TEXT NOT NULL,"
+                " text TEXT NOT NULL,"
+                " cleaned_text TEXT,"
+                " PRIMARY KEY (pdf_hash, page_num, config_hash))"
+            )
+
+    def get(
+        self,
+        pdf_hash: str,
+        page_num: int,
+        config_hash: str
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Look up a cached page.
+
+        Returns:
+            Tuple of (text, cleaned_text) or None if not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, cleaned_text FROM pages"
+                " WHERE pdf_hash = ? AND page_num = ? AND config_hash = ?",
+                (pdf_hash, page_num, config_hash)
+            ).fetchone()
+        return row
+
+    def put(
+        self,
+        pdf_hash: str,
+        page_num: int,
+        config_hash: str,
+        text: str,
+        cleaned_text: Optional[str] = None
+    ) -> None:
+        """Store (or replace) a page's results."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (pdf_hash, page_num, config_hash, text, cleaned_text)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ResultCache:
+    """
+    Persistent key/text cache for engine results.
+
+    Keys are content hashes built by the engine (e.g. image bytes plus
+    the settings that affect the output), so identical inputs hit the
+    cache regardless of which document or run they came from.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+        """
+        self._lock = threading.Lock()
+        self._conn = _connect(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " text TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached result, or None if not cached."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, text: str) -> None:
+        """Store (or replace) a result."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?)", (key, text)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
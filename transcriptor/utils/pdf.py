@@ -5,8 +5,15 @@ Provides utilities for PDF handling including page counting,
 page selection parsing, and efficient image conversion.
 """
 
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from enum import StrEnum
+from functools import lru_cache
+from itertools import compress
 from pathlib import Path
-from typing import List, Tuple, Iterator
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from PIL import Image
 
@@ -17,6 +24,38 @@ try:
 except ImportError:
     PDF2IMAGE_AVAILABLE = False
 
+# Optional in-process renderer - no pdftoppm subprocess or image files
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    pymupdf = None
+    PYMUPDF_AVAILABLE = False
+
+
+class _Backend(StrEnum):
+    """PDF rendering backends."""
+    PYMUPDF = "pymupdf"
+    PDF2IMAGE = "pdf2image"
+
+
+# PyMuPDF when installed; PDF_SCRIBE_PDF_BACKEND=pdf2image forces Poppler
+_BACKEND = _Backend(
+    os.getenv("PDF_SCRIBE_PDF_BACKEND")
+    or (_Backend.PYMUPDF if PYMUPDF_AVAILABLE else _Backend.PDF2IMAGE)
+)
+
+# MuPDF is not thread-safe; pages are rendered one at a time per process
+_PYMUPDF_LOCK = threading.Lock()
+
+# Unrequested pages convert_pages_iter renders to join two Poppler calls;
+# rendering a page is cheaper than reparsing the PDF for another call
+_MAX_RUN_GAP = 2
+
+# Page images convert_single_page keeps by default; each is a full
+# raster, so caching is opt-in (see PDFUtils.set_cache_size)
+_RENDER_CACHE_SIZE = 0
+
 
 class PDFError(Exception):
     """PDF-related errors."""
@@ -33,7 +72,9 @@ class PDFUtils:
 
     @staticmethod
     def is_available() -> bool:
-        """Check if pdf2image is available."""
+        """Check if the selected rendering backend is available."""
+        if _BACKEND is _Backend.PYMUPDF:
+            return PYMUPDF_AVAILABLE
         return PDF2IMAGE_AVAILABLE
 
     @staticmethod
@@ -50,14 +91,38 @@ class PDFUtils:
         Raises:
             PDFError: If page count cannot be determined
         """
+        _check_backend()
+
+        try:
+            return _page_count(*_file_key(pdf_path))
+        except Exception as e:
+            raise PDFError(f"Could not get page count: {e}")
+
+    @staticmethod
+    def get_pdf_info(pdf_path: Path, page_num: int = 0) -> Dict[str, Any]:
+        """
+        Get Poppler's pdfinfo for a PDF (cached).
+
+        Results are memoized on the file's path, size and modification
+        time, so repeated lookups don't spawn pdfinfo again.
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_num: Also report this page's size and rotation (0 = none)
+
+        Returns:
+            pdfinfo fields, e.g. "Pages" or "Page    N size"
+
+        Raises:
+            PDFError: If pdf2image is missing or pdfinfo fails
+        """
         if not PDF2IMAGE_AVAILABLE:
             raise PDFError("pdf2image not installed")
 
         try:
-            info = pdfinfo_from_path(str(pdf_path))
-            return info["Pages"]
+            return dict(_pdfinfo(*_file_key(pdf_path), page_num))
         except Exception as e:
-            raise PDFError(f"Could not get page count: {e}")
+            raise PDFError(f"Could not read PDF info: {e}")
 
     @staticmethod
     def parse_page_range(page_spec: str, total_pages: int) -> List[int]:
@@ -77,25 +142,27 @@ class PDFUtils:
         Returns:
             Sorted list of unique page numbers
         """
-        pages = set()
+        # One flag byte per page: ranges are slice assignments rather
+        # than a set insert per page, and reading the flags back in page
+        # order replaces the sort
+        selected = bytearray(total_pages + 1)
 
         for part in page_spec.split(','):
             part = part.strip()
             if '-' in part:
                 # Range like "1-5"
                 start, end = part.split('-', 1)
-                start = int(start.strip())
-                end = int(end.strip())
-                for p in range(start, min(end + 1, total_pages + 1)):
-                    if p >= 1:
-                        pages.add(p)
+                start = max(int(start.strip()), 1)
+                end = min(int(end.strip()), total_pages)
+                if start <= end:
+                    selected[start:end + 1] = b"\x01" * (end - start + 1)
             else:
                 # Single page
                 p = int(part)
                 if 1 <= p <= total_pages:
-                    pages.add(p)
+                    selected[p] = 1
 
-        return sorted(pages)
+        return list(compress(range(total_pages + 1), selected))
 
     @staticmethod
     def is_contiguous(pages: List[int]) -> bool:
@@ -103,64 +170,182 @@ class PDFUtils:
         Check if a list of pages is contiguous.
 
         Args:
-            pages: Sorted list of page numbers
+            pages: Sorted list of unique page numbers, as returned by
+                parse_page_range
 
         Returns:
             True if pages form a contiguous range
         """
-        if not pages:
-            return True
-        return pages == list(range(min(pages), max(pages) + 1))
+        return not pages or pages[-1] - pages[0] + 1 == len(pages)
+
+    @staticmethod
+    def get_page_size(pdf_path: Path, page_num: int) -> Tuple[float, float]:
+        """
+        Get the size of a page in points (1/72 inch).
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_num: Page number
+
+        Returns:
+            Tuple of (width, height) in points
+
+        Raises:
+            PDFError: If the size cannot be determined
+        """
+        _check_backend()
+
+        try:
+            return _page_size(*_file_key(pdf_path), page_num)
+        except Exception as e:
+            raise PDFError(f"Could not get size of page {page_num}: {e}")
+
+    @staticmethod
+    def compute_optimal_dpi(
+        pdf_path: Path,
+        page_num: int,
+        target_long_edge_px: int
+    ) -> int:
+        """
+        Get the highest DPI at which a page fits a pixel budget.
+
+        Rendering straight at this DPI costs a fraction of rendering at a
+        higher one and downscaling: pixel count goes with DPI squared.
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_num: Page number
+            target_long_edge_px: Longest image edge in pixels
+
+        Returns:
+            DPI whose render has a longest edge of at most the target
+        """
+        return _fit_dpi(
+            max(PDFUtils.get_page_size(pdf_path, page_num)),
+            target_long_edge_px
+        )
+
+    @staticmethod
+    def _run_dpi(
+        pdf_path: Path,
+        run: List[int],
+        dpi: int,
+        max_long_edge: int
+    ) -> int:
+        """DPI for one Poppler call, capped by the largest page it renders."""
+        if not max_long_edge:
+            return dpi
+        try:
+            long_edge = _long_edge(*_file_key(pdf_path), run[0], run[-1])
+        except Exception:
+            # Size unknown: render as asked and let the processor downscale
+            return dpi
+        return min(dpi, _fit_dpi(long_edge, max_long_edge))
 
     @staticmethod
     def convert_pages(
         pdf_path: Path,
         pages: List[int],
-        dpi: int = 150
+        dpi: int = 150,
+        grayscale: bool = False,
+        thread_count: int = 1,
+        max_long_edge: int = 0
     ) -> List[Tuple[int, Image.Image]]:
         """
-        Convert specific PDF pages to images efficiently.
+        Convert specific PDF pages to images.
 
-        Uses single conversion for contiguous ranges, individual
-        conversions for non-contiguous pages.
+        Collects convert_pages_iter into a list, so every page image is
+        in memory at once; prefer convert_pages_iter for more than a few
+        pages.
 
         Args:
             pdf_path: Path to the PDF file
             pages: List of page numbers to convert
             dpi: Resolution for conversion
+            grayscale: Render single-channel (L) images
+            thread_count: Poppler processes per conversion call
+            max_long_edge: Longest image edge in pixels; larger pages
+                render at a lower DPI to fit (0 = no limit)
 
         Returns:
             List of (page_num, image) tuples
         """
-        if not PDF2IMAGE_AVAILABLE:
-            raise PDFError("pdf2image not installed")
+        return list(PDFUtils.convert_pages_iter(
+            pdf_path, pages, dpi,
+            grayscale=grayscale, thread_count=thread_count,
+            max_long_edge=max_long_edge
+        ))
 
-        if not pages:
-            return []
+    @staticmethod
+    def render_pages(
+        pdf_path: Path,
+        pages: List[int],
+        dpi: int,
+        output_folder: Path,
+        grayscale: bool = False,
+        thread_count: int = 1,
+        max_long_edge: int = 0
+    ) -> List[Tuple[int, str]]:
+        """
+        Render PDF pages to image files instead of in-memory images.
 
-        result = []
+        With PyMuPDF the document is opened once for all pages; with
+        pdf2image each contiguous run of pages is one Poppler call, so the
+        PDF is parsed once per run rather than once per page. The files
+        are uncompressed PPM/PGM, which is cheap to write and to read back.
 
-        # Check if pages are contiguous
-        if PDFUtils.is_contiguous(pages):
-            # Single conversion call for efficiency
-            images = convert_from_path(
-                str(pdf_path),
-                dpi=dpi,
-                first_page=min(pages),
-                last_page=max(pages)
-            )
-            result = list(zip(pages, images))
-        else:
-            # Convert each page individually
-            for page_num in pages:
-                images = convert_from_path(
+        Args:
+            pdf_path: Path to the PDF file
+            pages: Sorted list of page numbers to render
+            dpi: Resolution for conversion
+            output_folder: Directory to write the images to
+            grayscale: Render single-channel images (PGM)
+            thread_count: Poppler processes per contiguous run
+            max_long_edge: Longest image edge in pixels; larger pages
+                render at a lower DPI to fit (0 = no limit)
+
+        Returns:
+            List of (page_num, image path) tuples
+
+        Raises:
+            PDFError: If conversion fails
+        """
+        _check_backend()
+
+        if _BACKEND is _Backend.PYMUPDF:
+            result = []
+            ext = "pgm" if grayscale else "ppm"
+            with _open_pymupdf(pdf_path) as doc:
+                for page_num in pages:
+                    path = str(output_folder / f"page-{page_num}.{ext}")
+                    try:
+                        with _PYMUPDF_LOCK:
+                            _render_pymupdf(
+                                doc, page_num, dpi, grayscale, max_long_edge
+                            ).save(path)
+                    except Exception as e:
+                        raise PDFError(f"Failed to convert page {page_num}: {e}")
+                    result.append((page_num, path))
+            return result
+
+        result = []
+        for run in _page_runs(pages):
+            try:
+                paths = convert_from_path(
                     str(pdf_path),
-                    dpi=dpi,
-                    first_page=page_num,
-                    last_page=page_num
+                    dpi=PDFUtils._run_dpi(pdf_path, run, dpi, max_long_edge),
+                    first_page=run[0],
+                    last_page=run[-1],
+                    output_folder=str(output_folder),
+                    paths_only=True,
+                    grayscale=grayscale,
+                    thread_count=thread_count
                 )
-                if images:
-                    result.append((page_num, images[0]))
+            except Exception as e:
+                raise PDFError(
+                    f"Failed to convert pages {run[0]}-{run[-1]}: {e}"
+                )
+            result.extend(zip(run, paths))
 
         return result
 
@@ -168,47 +353,93 @@ class PDFUtils:
     def convert_pages_iter(
         pdf_path: Path,
         pages: List[int],
-        dpi: int = 150
+        dpi: int = 150,
+        grayscale: bool = False,
+        thread_count: int = 1,
+        chunk_size: int = 10,
+        max_long_edge: int = 0
     ) -> Iterator[Tuple[int, Image.Image]]:
         """
         Convert PDF pages to images as a generator.
 
-        Memory-efficient for large documents.
+        Memory-efficient for large documents: only the page being yielded
+        is held. With PyMuPDF pages are rendered one at a time from one
+        open document. With pdf2image, spans of up to chunk_size pages are
+        one Poppler call writing to a temporary folder, and each page file
+        is loaded and deleted as it is yielded. Pages separated by a small
+        gap share a call; the unrequested pages in between are discarded.
 
         Args:
             pdf_path: Path to the PDF file
             pages: List of page numbers to convert
             dpi: Resolution for conversion
+            grayscale: Render single-channel (L) images
+            thread_count: Poppler processes per conversion call
+            chunk_size: Most pages per Poppler call
+            max_long_edge: Longest image edge in pixels; larger pages
+                render at a lower DPI to fit (0 = no limit)
 
         Yields:
             (page_num, image) tuples
         """
-        if not PDF2IMAGE_AVAILABLE:
-            raise PDFError("pdf2image not installed")
-
-        for page_num in pages:
-            images = convert_from_path(
-                str(pdf_path),
-                dpi=dpi,
-                first_page=page_num,
-                last_page=page_num
-            )
-            if images:
-                yield (page_num, images[0])
+        _check_backend()
+
+        if _BACKEND is _Backend.PYMUPDF:
+            with _open_pymupdf(pdf_path) as doc:
+                for page_num in pages:
+                    yield (page_num, _convert_page_pymupdf(
+                        doc, page_num, dpi, grayscale, max_long_edge
+                    ))
+            return
+
+        with tempfile.TemporaryDirectory(prefix="pdf-scribe-") as tmp:
+            for run in _page_runs(pages, chunk_size, _MAX_RUN_GAP):
+                span = list(range(run[0], run[-1] + 1))
+                paths = convert_from_path(
+                    str(pdf_path),
+                    dpi=PDFUtils._run_dpi(pdf_path, span, dpi, max_long_edge),
+                    first_page=span[0],
+                    last_page=span[-1],
+                    output_folder=tmp,
+                    paths_only=True,
+                    grayscale=grayscale,
+                    thread_count=thread_count
+                )
+                wanted = set(run)
+                for page_num, path in zip(span, paths):
+                    if page_num not in wanted:
+                        os.remove(path)
+                        continue
+                    image = Image.open(path)
+                    image.load()
+                    os.remove(path)
+                    yield (page_num, image)
 
     @staticmethod
     def convert_single_page(
         pdf_path: Path,
         page_num: int,
-        dpi: int = 150
+        dpi: int = 150,
+        grayscale: bool = False,
+        max_long_edge: int = 0
     ) -> Image.Image:
         """
         Convert a single PDF page to an image.
 
+        With caching enabled (see set_cache_size), recently rendered
+        pages are kept by file version (see _file_key) and rendering
+        options, so rendering a page again, e.g. to retry with other
+        preprocessing, skips the renderer. Each call returns a new image.
+        Caching is off by default: a pass over a document renders each
+        page once, and every cached page costs two full-frame copies.
+
         Args:
             pdf_path: Path to the PDF file
             page_num: Page number to convert
             dpi: Resolution for conversion
+            grayscale: Render a single-channel (L) image
+            max_long_edge: Longest image edge in pixels; larger pages
+                render at a lower DPI to fit (0 = no limit)
 
         Returns:
             PIL Image
@@ -216,18 +447,224 @@ class PDFUtils:
         Raises:
             PDFError: If conversion fails
         """
-        if not PDF2IMAGE_AVAILABLE:
-            raise PDFError("pdf2image not installed")
+        _check_backend()
 
         try:
-            images = convert_from_path(
-                str(pdf_path),
-                dpi=dpi,
-                first_page=page_num,
-                last_page=page_num
+            if _render_cached is None:
+                return _render_page(
+                    str(pdf_path), page_num, dpi, grayscale, max_long_edge
+                )
+            mode, size, data = _render_cached(
+                *_file_key(pdf_path), page_num, dpi, grayscale, max_long_edge
             )
-            if images:
-                return images[0]
-            raise PDFError(f"No image returned for page {page_num}")
+        except PDFError:
+            raise
         except Exception as e:
             raise PDFError(f"Failed to convert page {page_num}: {e}")
+        return Image.frombytes(mode, size, data)
+
+    @staticmethod
+    def set_cache_size(size: int) -> None:
+        """
+        Resize the convert_single_page image cache, emptying it.
+
+        Args:
+            size: Most page images to keep (0 disables caching)
+        """
+        global _render_cached
+        _render_cached = _make_render_cache(size)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget page images cached by convert_single_page."""
+        if _render_cached is not None:
+            _render_cached.cache_clear()
+
+
+def _page_runs(
+    pages: List[int],
+    max_len: Optional[int] = None,
+    max_gap: int = 0
+) -> Iterator[List[int]]:
+    """
+    Split sorted pages into runs spanning at most max_len pages.
+
+    Consecutive pages up to max_gap missing pages apart share a run.
+    """
+    start = 0
+    for i in range(1, len(pages) + 1):
+        if (i < len(pages) and pages[i] - pages[i - 1] <= max_gap + 1
+                and (max_len is None or pages[i] - pages[start] < max_len)):
+            continue
+        yield pages[start:i]
+        start = i
+
+
+def _fit_dpi(long_edge_pt: float, max_long_edge: int) -> int:
+    """Highest DPI rendering long_edge_pt points in max_long_edge pixels."""
+    # One pixel of slack for the renderer rounding up
+    return max(1, int((max_long_edge - 1) * 72 / long_edge_pt))
+
+
+def _file_key(pdf_path: Path) -> Tuple[str, int, int]:
+    """Cache key for a file: path, modification time and size."""
+    st = os.stat(pdf_path)
+    return str(pdf_path), st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=128)
+def _pdfinfo(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    page_num: int = 0
+) -> Dict[str, Any]:
+    """pdfinfo for a file version (see _file_key); don't mutate the result."""
+    page = page_num or None
+    return pdfinfo_from_path(path, first_page=page, last_page=page)
+
+
+@lru_cache(maxsize=128)
+def _page_count(path: str, mtime_ns: int, size: int) -> int:
+    """Page count for a file version (see _file_key)."""
+    if _BACKEND is _Backend.PYMUPDF:
+        with _PYMUPDF_LOCK, pymupdf.open(path) as doc:
+            return doc.page_count
+    return _pdfinfo(path, mtime_ns, size)["Pages"]
+
+
+@lru_cache(maxsize=1024)
+def _page_size(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    page_num: int
+) -> Tuple[float, float]:
+    """Page size in points for a file version (see _file_key)."""
+    if _BACKEND is _Backend.PYMUPDF:
+        with _PYMUPDF_LOCK, pymupdf.open(path) as doc:
+            rect = doc.load_page(page_num - 1).rect
+            return rect.width, rect.height
+    info = _pdfinfo(path, mtime_ns, size, page_num)
+    # "Page    N size: 612 x 792 pts (letter)"
+    page_size = next(v for k, v in info.items() if k.endswith("size"))
+    width, _, height = page_size.split()[:3]
+    return float(width), float(height)
+
+
+@lru_cache(maxsize=128)
+def _long_edge(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    first_page: int,
+    last_page: int
+) -> float:
+    """Longest page edge in points over a page range (see _file_key)."""
+    if _BACKEND is _Backend.PYMUPDF:
+        return max(
+            max(_page_size(path, mtime_ns, size, page_num))
+            for page_num in range(first_page, last_page + 1)
+        )
+    # One pdfinfo call lists "Page    N size: ..." for every page
+    info = pdfinfo_from_path(path, first_page=first_page, last_page=last_page)
+    return max(
+        max(float(value.split()[0]), float(value.split()[2]))
+        for key, value in info.items()
+        if key.startswith("Page") and key.endswith("size")
+    )
+
+
+def _render_page(
+    path: str,
+    page_num: int,
+    dpi: int,
+    grayscale: bool,
+    max_long_edge: int
+) -> Image.Image:
+    """Render one page (1-based) to a PIL image."""
+    if _BACKEND is _Backend.PYMUPDF:
+        with _open_pymupdf(Path(path)) as doc:
+            return _convert_page_pymupdf(
+                doc, page_num, dpi, grayscale, max_long_edge
+            )
+    images = convert_from_path(
+        path,
+        dpi=PDFUtils._run_dpi(Path(path), [page_num], dpi, max_long_edge),
+        first_page=page_num,
+        last_page=page_num,
+        grayscale=grayscale
+    )
+    if not images:
+        raise PDFError(f"No image returned for page {page_num}")
+    return images[0]
+
+
+def _render_page_raw(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    page_num: int,
+    dpi: int,
+    grayscale: bool,
+    max_long_edge: int
+) -> Tuple[str, Tuple[int, int], bytes]:
+    """Render one page of a file version to (mode, size, pixels)."""
+    image = _render_page(path, page_num, dpi, grayscale, max_long_edge)
+    return image.mode, image.size, image.tobytes()
+
+
+def _make_render_cache(size: int) -> Optional[Callable[..., Any]]:
+    """An LRU-cached _render_page_raw, or None when size is 0."""
+    return lru_cache(maxsize=size)(_render_page_raw) if size else None
+
+
+_render_cached = _make_render_cache(_RENDER_CACHE_SIZE)
+
+
+def _check_backend() -> None:
+    """Raise PDFError unless the selected backend is installed."""
+    if not PDFUtils.is_available():
+        raise PDFError(f"{_BACKEND.value} not installed")
+
+
+@contextmanager
+def _open_pymupdf(pdf_path: Path) -> Iterator["pymupdf.Document"]:
+    """Open a document with PyMuPDF for the duration of a block."""
+    with _PYMUPDF_LOCK:
+        doc = pymupdf.open(str(pdf_path))
+    try:
+        yield doc
+    finally:
+        with _PYMUPDF_LOCK:
+            doc.close()
+
+
+def _render_pymupdf(
+    doc: "pymupdf.Document",
+    page_num: int,
+    dpi: int,
+    grayscale: bool = False,
+    max_long_edge: int = 0
+) -> "pymupdf.Pixmap":
+    """Render one page (1-based) to a pixmap. Hold _PYMUPDF_LOCK."""
+    page = doc.load_page(page_num - 1)
+    if max_long_edge:
+        long_edge = max(page.rect.width, page.rect.height)
+        dpi = min(dpi, _fit_dpi(long_edge, max_long_edge))
+    colorspace = pymupdf.csGRAY if grayscale else pymupdf.csRGB
+    return page.get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+
+
+def _convert_page_pymupdf(
+    doc: "pymupdf.Document",
+    page_num: int,
+    dpi: int,
+    grayscale: bool = False,
+    max_long_edge: int = 0
+) -> Image.Image:
+    """Render one page (1-based) to a PIL image."""
+    with _PYMUPDF_LOCK:
+        pix = _render_pymupdf(doc, page_num, dpi, grayscale, max_long_edge)
+        mode = "L" if pix.n == 1 else "RGB"
+        return Image.frombytes(mode, (pix.width, pix.height), pix.samples)